@@ -17,20 +17,25 @@ import sys
 import os
 import time
 import signal
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
-import traceback
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config import Config
 from src.database import Database
-from src.auth import Authenticator, AuthenticationError
-from src.scraper import NewsScraper, ScrapingError
 from src.notifier import Notifier, NotificationError
 
+# Selenium-backed modules are imported where they are used so that
+# --stats and --test-email don't pay for loading the browser stack
+if TYPE_CHECKING:
+    from src.auth import Authenticator
+    from src.scraper import NewsScraper
+
 
 class GomuNewsMonitor:
     """
@@ -49,9 +54,11 @@ class GomuNewsMonitor:
         self.config = Config(config_path)
         self.database = Database(self.config.db_path)
         self.notifier = Notifier(self.config)
-        self.scraper: Optional[NewsScraper] = None
-        self.authenticator: Optional[Authenticator] = None
+        self.scraper: Optional['NewsScraper'] = None
+        self.authenticator: Optional['Authenticator'] = None
+        self._translator = None
         self.running = False
+        self._shutdown = threading.Event()
         self.logger = logging.getLogger(__name__)
 
         # Setup signal handlers for graceful shutdown
@@ -60,8 +67,17 @@ class GomuNewsMonitor:
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
-        self.logger.info(f"Received signal {signum}, shutting down...")
+        self.logger.info("Received signal %s, shutting down...", signum)
         self.running = False
+        self._shutdown.set()
+
+    @property
+    def translator(self):
+        """Get the shared translator, importing and creating it on first use."""
+        if self._translator is None:
+            from src.translator import get_translator
+            self._translator = get_translator(self.config.translation_cache_path)
+        return self._translator
 
     def run_once(self) -> Dict[str, Any]:
         """
@@ -75,6 +91,9 @@ class GomuNewsMonitor:
             >>> stats = monitor.run_once()
             >>> print(f"Found {stats['new_articles']} new articles")
         """
+        from src.auth import Authenticator, AuthenticationError
+        from src.scraper import NewsScraper, ScrapingError
+
         start_time = time.time()
         stats = {
             'articles_found': 0,
@@ -86,23 +105,28 @@ class GomuNewsMonitor:
 
         try:
             self.logger.info("=" * 60)
-            self.logger.info(f"Starting monitoring cycle: {datetime.now()}")
+            self.logger.info("Starting monitoring cycle: %s", datetime.now())
             self.logger.info("=" * 60)
 
-            # Initialize scraper
-            self.logger.info("Initializing web scraper...")
-            self.scraper = NewsScraper(self.config)
-            self.scraper.start()
+            # Initialize scraper, reusing the browser from the previous cycle
+            if self.scraper is None:
+                self.logger.info("Initializing web scraper...")
+                self.scraper = NewsScraper(self.config)
+                self.scraper.start()
+            else:
+                self.scraper.reset()
 
             # Authenticate if enabled and credentials are configured
             if self.config.auth_enabled and self.config.login_email and self.config.login_password:
                 self.logger.info("Authenticating...")
-                self.authenticator = Authenticator(self.config, self.scraper.driver)
+                # Reuse the authenticator while the browser it logged in with is alive
+                if self.authenticator is None or self.authenticator.driver is not self.scraper.driver:
+                    self.authenticator = Authenticator(self.config, self.scraper.driver)
                 try:
                     self.authenticator.login()
                     self.logger.info("Authentication successful")
                 except AuthenticationError as e:
-                    self.logger.warning(f"Authentication failed: {e}")
+                    self.logger.warning("Authentication failed: %s", e)
                     if self.config.auth_continue_on_failure:
                         self.logger.info("Continuing without authentication (public articles only)")
                     else:
@@ -117,76 +141,36 @@ class GomuNewsMonitor:
             articles = self.scraper.scrape_articles()
             stats['articles_found'] = len(articles)
 
-            self.logger.info(f"Found {len(articles)} articles matching keywords")
+            self.logger.info("Found %d articles matching keywords", len(articles))
 
-            # Process new articles
-            new_articles = []
-            for article in articles:
-                if not self.database.article_exists(article['article_id']):
-                    # Optionally fetch full content
-                    if self.config.get('email.include_full_content', False):
-                        self.logger.debug(f"Fetching full content for: {article['title']}")
-                        article['full_content'] = self.scraper.fetch_full_content(article['url'])
+            # Store new articles (already stored ones are skipped by the database)
+            new_articles = self.database.try_insert_articles(articles)
+            for article in new_articles:
+                self.logger.info("New article: %s", article['title'])
 
-                    # Add to database
-                    if self.database.add_article(article):
-                        new_articles.append(article)
-                        self.logger.info(f"New article: {article['title']}")
+            include_full_content = self.config.get('email.include_full_content', False)
 
-            stats['new_articles'] = len(new_articles)
+            # Optionally fetch full content (concurrently, one request per article)
+            if new_articles and include_full_content:
+                self.logger.info("Fetching full content for %d articles...", len(new_articles))
+                contents = self.scraper.fetch_full_content_many(
+                    [article['url'] for article in new_articles]
+                )
+                for article, content in zip(new_articles, contents):
+                    article['full_content'] = content
 
-            # Translate new article titles to Korean
-            if new_articles and self.config.get('translation.enabled', True):
-                self.logger.info(f"Translating {len(new_articles)} article titles...")
-                try:
-                    from src.translator import get_translator
-                    translator = get_translator()
-
-                    translated_count = 0
-                    failed_count = 0
-
-                    for article in new_articles:
-                        try:
-                            title_ko = translator.translate(article['title'])
-                            if title_ko:
-                                article['title_ko'] = title_ko
-                                # Update database with translation
-                                self.database.update_article_translation(
-                                    article['article_id'],
-                                    title_ko
-                                )
-                                translated_count += 1
-                            else:
-                                article['title_ko'] = None
-                                failed_count += 1
-                                self.logger.warning(f"Translation failed for: {article['title'][:50]}...")
-                        except Exception as e:
-                            article['title_ko'] = None
-                            failed_count += 1
-                            self.logger.error(f"Translation error: {e}")
-
-                    self.logger.info(f"Translation complete: {translated_count} successful, {failed_count} failed")
-
-                except Exception as e:
-                    self.logger.error(f"Translation module error: {e}")
-                    # Continue without translations
-                    for article in new_articles:
-                        article['title_ko'] = None
-
-            # Send notifications for new articles
-            if new_articles:
-                self.logger.info(f"Sending notifications for {len(new_articles)} new articles...")
+                self.database.update_full_content_bulk(
+                    [(article['article_id'], article['full_content']) for article in new_articles]
+                )
 
-                if self.notifier.send_article_notifications(new_articles):
-                    # Mark articles as notified
-                    article_ids = [a['article_id'] for a in new_articles]
+            stats['new_articles'] = len(new_articles)
 
-                    # Get database IDs for the articles we just added
-                    unnotified = self.database.get_unnotified_articles()
-                    db_ids = [a['id'] for a in unnotified if a['article_id'] in article_ids]
+            # Translate titles and send notifications for new articles
+            if new_articles:
+                notified_count = self._translate_and_notify(new_articles)
+                stats['notifications_sent'] = notified_count
 
-                    self.database.mark_multiple_as_notified(db_ids)
-                    stats['notifications_sent'] = len(new_articles)
+                if notified_count == len(new_articles):
                     self.logger.info("Notifications sent successfully")
                 else:
                     self.logger.warning("Failed to send notifications")
@@ -198,25 +182,27 @@ class GomuNewsMonitor:
             if self.config.cleanup_enabled:
                 deleted = self.database.cleanup_old_records(self.config.keep_records_days)
                 if deleted > 0:
-                    self.logger.info(f"Cleaned up {deleted} old records")
+                    self.logger.info("Cleaned up %d old records", deleted)
 
         except ScrapingError as e:
-            self.logger.error(f"Scraping error: {e}")
+            self.logger.error("Scraping error: %s", e)
             stats['status'] = 'error'
             stats['error_message'] = str(e)
             self._handle_error(e)
 
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.error("Unexpected error: %s", e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                import traceback
+                self.logger.debug(traceback.format_exc())
             stats['status'] = 'error'
             stats['error_message'] = str(e)
             self._handle_error(e)
 
         finally:
-            # Cleanup
-            if self.scraper:
-                self.scraper.stop()
+            # Discard the browser after errors so the next cycle starts fresh
+            if stats['status'] == 'error':
+                self.close_scraper()
 
             # Log monitoring run
             execution_time = time.time() - start_time
@@ -231,14 +217,129 @@ class GomuNewsMonitor:
             )
 
             self.logger.info("-" * 60)
-            self.logger.info(f"Monitoring cycle completed in {execution_time:.2f}s")
-            self.logger.info(f"Articles found: {stats['articles_found']}, "
-                           f"New: {stats['new_articles']}, "
-                           f"Notified: {stats['notifications_sent']}")
+            self.logger.info("Monitoring cycle completed in %.2fs", execution_time)
+            self.logger.info("Articles found: %d, New: %d, Notified: %d",
+                             stats['articles_found'],
+                             stats['new_articles'],
+                             stats['notifications_sent'])
             self.logger.info("-" * 60)
 
         return stats
 
+    def _translate_and_notify(self, new_articles: List[Dict[str, Any]]) -> int:
+        """
+        Translate article titles and send notifications, overlapping the two.
+
+        Each notification email is handed to the notifier as soon as every
+        article it contains has been translated, so SMTP sends run while the
+        remaining titles are still being translated.
+
+        Args:
+            new_articles: List of newly stored articles
+
+        Returns:
+            Number of articles notified successfully
+        """
+        groups = self.notifier.group_articles(new_articles)
+        sends = []
+
+        self.logger.info("Sending notifications for %d new articles...", len(new_articles))
+
+        # A single worker keeps SMTP sends serialized; the session lets every
+        # email of this run share one SMTP connection (and TLS/AUTH handshake)
+        with self.notifier.session(), ThreadPoolExecutor(max_workers=1) as notify_executor:
+            def notify(group: List[Dict[str, Any]]) -> None:
+                future = notify_executor.submit(self.notifier.send_article_notifications, group)
+                sends.append((future, group))
+
+            if self.config.get('translation.enabled', True):
+                self._translate_titles(new_articles, groups, notify)
+            else:
+                for group in groups:
+                    notify(group)
+
+            notified_ids = []
+            for future, group in sends:
+                if future.result():
+                    notified_ids.extend(article['article_id'] for article in group)
+
+        # Mark articles as notified
+        self.database.mark_notified_by_article_ids(notified_ids)
+        return len(notified_ids)
+
+    def _translate_titles(
+        self,
+        new_articles: List[Dict[str, Any]],
+        groups: List[List[Dict[str, Any]]],
+        on_group_ready: Callable[[List[Dict[str, Any]]], None]
+    ) -> None:
+        """
+        Translate new article titles to Korean.
+
+        Args:
+            new_articles: List of newly stored articles
+            groups: Notification groups partitioning new_articles
+            on_group_ready: Called with each group once all its titles are done
+        """
+        self.logger.info("Translating %d article titles...", len(new_articles))
+
+        remaining = {id(group): len(group) for group in groups}
+        group_of = {id(article): group for group in groups for article in group}
+
+        try:
+            translator = self.translator
+
+            translated_count = 0
+            failed_count = 0
+            translations = []
+
+            # Titles are translated concurrently; the translator itself
+            # enforces the minimum interval between outgoing requests
+            max_workers = self.config.get('translation.workers', 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(translator.translate, article['title']): article
+                    for article in new_articles
+                }
+
+                for future in as_completed(futures):
+                    article = futures[future]
+                    try:
+                        title_ko = future.result()
+                    except Exception as e:
+                        title_ko = None
+                        self.logger.error("Translation error: %s", e)
+                    else:
+                        if not title_ko:
+                            self.logger.warning("Translation failed for: %.50s...", article['title'])
+
+                    article['title_ko'] = title_ko
+                    if title_ko:
+                        translations.append((article['article_id'], title_ko))
+                        translated_count += 1
+                    else:
+                        failed_count += 1
+
+                    group = group_of[id(article)]
+                    remaining[id(group)] -= 1
+                    if remaining[id(group)] == 0:
+                        on_group_ready(group)
+
+            # Update database with translations in a single transaction
+            self.database.update_article_translations_bulk(translations)
+
+            self.logger.info("Translation complete: %d successful, %d failed", translated_count, failed_count)
+
+        except Exception as e:
+            self.logger.error("Translation module error: %s", e)
+            # Continue without translations for anything not yet sent
+            for group in groups:
+                if remaining[id(group)] > 0:
+                    remaining[id(group)] = 0
+                    for article in group:
+                        article.setdefault('title_ko', None)
+                    on_group_ready(group)
+
     def run_daemon(self) -> None:
         """
         Run monitoring in daemon mode (continuous loop).
@@ -250,13 +351,18 @@ class GomuNewsMonitor:
             >>> monitor.run_daemon()  # Runs until Ctrl+C
         """
         self.running = True
+        self._shutdown.clear()
         consecutive_errors = 0
         max_consecutive_errors = 5
 
         self.logger.info("Starting daemon mode...")
-        self.logger.info(f"Check interval: {self.config.check_interval_minutes} minutes")
+        self.logger.info("Check interval: %s minutes", self.config.check_interval_minutes)
 
         while self.running:
+            # Schedule the next check relative to the start of this cycle
+            interval_seconds = self.config.check_interval_minutes * 60
+            deadline = time.monotonic() + interval_seconds
+
             try:
                 stats = self.run_once()
 
@@ -264,10 +370,10 @@ class GomuNewsMonitor:
                     consecutive_errors = 0
                 else:
                     consecutive_errors += 1
-                    self.logger.warning(f"Consecutive errors: {consecutive_errors}/{max_consecutive_errors}")
+                    self.logger.warning("Consecutive errors: %d/%d", consecutive_errors, max_consecutive_errors)
 
                     if consecutive_errors >= max_consecutive_errors:
-                        self.logger.critical(f"Too many consecutive errors ({consecutive_errors}), stopping daemon")
+                        self.logger.critical("Too many consecutive errors (%d), stopping daemon", consecutive_errors)
                         self.notifier.send_error_notification(
                             f"Monitoring daemon stopped after {consecutive_errors} consecutive errors.\n"
                             f"Last error: {stats['error_message']}"
@@ -279,27 +385,37 @@ class GomuNewsMonitor:
                 break
 
             except Exception as e:
-                self.logger.error(f"Critical error in daemon loop: {e}")
+                self.logger.error("Critical error in daemon loop: %s", e)
                 consecutive_errors += 1
 
             # Wait for next check
             if self.running:
-                next_check = datetime.now()
-                next_check = next_check.replace(
-                    minute=(next_check.minute + self.config.check_interval_minutes) % 60
-                )
-                self.logger.info(f"Next check at: {next_check.strftime('%H:%M')}")
-                self.logger.info(f"Waiting {self.config.check_interval_minutes} minutes...\n")
+                sleep_time = max(0.0, deadline - time.monotonic())
+                next_check = datetime.now() + timedelta(seconds=sleep_time)
+                self.logger.info("Next check at: %s", next_check.strftime('%H:%M'))
+                self.logger.info("Waiting %.1f minutes...\n", sleep_time / 60)
 
-                # Sleep in small increments to allow for graceful shutdown
-                sleep_time = self.config.check_interval_minutes * 60
-                elapsed = 0
-                while elapsed < sleep_time and self.running:
-                    time.sleep(min(10, sleep_time - elapsed))
-                    elapsed += 10
+                # Wait until the next check, waking immediately on shutdown
+                if self._shutdown.wait(timeout=sleep_time):
+                    break
 
+        self.close_scraper()
+        self.database.close()
         self.logger.info("Daemon mode stopped")
 
+    def close_scraper(self) -> None:
+        """
+        Stop the scraper's browser, if one is running.
+
+        Example:
+            >>> monitor.run_once()
+            >>> monitor.close_scraper()
+        """
+        if self.scraper:
+            self.scraper.stop()
+            self.scraper = None
+        self.authenticator = None
+
     def _handle_error(self, error: Exception) -> None:
         """
         Handle errors by logging and optionally sending notifications.
@@ -320,7 +436,7 @@ class GomuNewsMonitor:
             recent_errors = recent_total - recent_success
 
             if recent_errors >= error_threshold:
-                self.logger.info(f"Error threshold reached ({recent_errors}), sending notification")
+                self.logger.info("Error threshold reached (%d), sending notification", recent_errors)
                 self.notifier.send_error_notification(error_msg)
 
     def print_statistics(self, days: int = 7) -> None:
@@ -404,6 +520,20 @@ def setup_logging(config: Config) -> None:
         )
 
 
+# (label, environment variable) pairs logged when running in GitHub Actions
+GITHUB_ENV_VARS = (
+    ('Workflow', 'GITHUB_WORKFLOW'),
+    ('Repository', 'GITHUB_REPOSITORY'),
+    ('Run Number', 'GITHUB_RUN_NUMBER'),
+    ('Run ID', 'GITHUB_RUN_ID'),
+    ('Run Attempt', 'GITHUB_RUN_ATTEMPT'),
+    ('Actor', 'GITHUB_ACTOR'),
+    ('Event Name', 'GITHUB_EVENT_NAME'),
+    ('Ref', 'GITHUB_REF'),
+    ('SHA', 'GITHUB_SHA'),
+)
+
+
 def detect_github_actions_environment(logger: logging.Logger) -> bool:
     """
     Detect if running in GitHub Actions environment and log details.
@@ -414,29 +544,19 @@ def detect_github_actions_environment(logger: logging.Logger) -> bool:
     Returns:
         bool: True if running in GitHub Actions, False otherwise
     """
-    is_github_actions = os.getenv('GITHUB_ACTIONS', '').lower() == 'true'
+    env = os.environ
+    is_github_actions = env.get('GITHUB_ACTIONS', '').lower() == 'true'
 
     if is_github_actions:
-        logger.info("=" * 60)
-        logger.info("🔍 GitHub Actions Environment Detected")
-        logger.info("=" * 60)
-
-        # Log relevant GitHub Actions environment variables
-        github_vars = {
-            'Workflow': os.getenv('GITHUB_WORKFLOW'),
-            'Repository': os.getenv('GITHUB_REPOSITORY'),
-            'Run Number': os.getenv('GITHUB_RUN_NUMBER'),
-            'Run ID': os.getenv('GITHUB_RUN_ID'),
-            'Run Attempt': os.getenv('GITHUB_RUN_ATTEMPT'),
-            'Actor': os.getenv('GITHUB_ACTOR'),
-            'Event Name': os.getenv('GITHUB_EVENT_NAME'),
-            'Ref': os.getenv('GITHUB_REF'),
-            'SHA': os.getenv('GITHUB_SHA', '')[:8] if os.getenv('GITHUB_SHA') else None,
-        }
-
-        for key, value in github_vars.items():
+        # Log relevant GitHub Actions environment variables in one record
+        lines = ["=" * 60, "🔍 GitHub Actions Environment Detected", "=" * 60]
+        for label, var in GITHUB_ENV_VARS:
+            value = env.get(var)
             if value:
-                logger.info(f"  {key}: {value}")
+                if var == 'GITHUB_SHA':
+                    value = value[:8]
+                lines.append(f"  {label}: {value}")
+        logger.info("\n".join(lines))
 
         # Set DEBUG logging level for better visibility in GitHub Actions logs
         root_logger = logging.getLogger()
@@ -526,6 +646,7 @@ Examples:
         # Handle different modes
         if args.stats:
             monitor.print_statistics(days=args.days)
+            monitor.database.close()
 
         elif args.test_email:
             logger.info("Sending test email...")
@@ -543,6 +664,9 @@ Examples:
             print("Login Page Debug Mode")
             print("=" * 60)
 
+            from src.auth import Authenticator
+            from src.scraper import NewsScraper
+
             # Initialize scraper
             scraper = NewsScraper(config)
             scraper.start()
@@ -577,8 +701,12 @@ Examples:
 
         elif args.mode == 'test':
             logger.info("Running in TEST mode (single run)")
-            stats = monitor.run_once()
+            try:
+                stats = monitor.run_once()
+            finally:
+                monitor.close_scraper()
             monitor.print_statistics(days=1)
+            monitor.database.close()
 
             if stats['status'] == 'success':
                 sys.exit(0)
@@ -600,6 +728,7 @@ Examples:
 
     except Exception as e:
         print(f"\n✗ Fatal error: {e}")
+        import traceback
         traceback.print_exc()
         sys.exit(1)
 
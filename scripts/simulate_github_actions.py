@@ -12,7 +12,9 @@ Usage:
 import os
 import sys
 import shutil
+import sqlite3
 from pathlib import Path
+from typing import Optional
 
 # 시뮬레이션 디렉토리
 ARTIFACTS_DIR = Path("temp_artifacts")
@@ -39,8 +41,14 @@ def simulate_download_artifact():
         # data/ 디렉토리 생성
         DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-        # DB 복사
-        shutil.copy(artifact_db, DB_PATH)
+        # DB 복원 (SQLite backup API로 일관된 스냅샷 복사)
+        src = sqlite3.connect(artifact_db)
+        dst = sqlite3.connect(DB_PATH)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+            src.close()
         print(f"✅ Restored to: {DB_PATH}")
 
         # DB 통계 확인
@@ -54,11 +62,14 @@ def simulate_download_artifact():
         return False
 
 
-def simulate_upload_artifact():
+def simulate_upload_artifact(conn: Optional[sqlite3.Connection] = None):
     """
     Artifact 업로드 시뮬레이션.
 
     현재 DB를 artifact로 저장합니다.
+
+    Args:
+        conn: 현재 DB에 열려 있는 연결 (None이면 새로 연결)
     """
     print("\n" + "=" * 60)
     print("📤 Step 3: Upload Updated Artifact")
@@ -72,60 +83,99 @@ def simulate_upload_artifact():
     # artifacts 디렉토리 생성
     ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # DB 복사
+    # DB 복사 (VACUUM INTO: WAL 내용까지 반영된 단일 파일로 압축 저장)
     artifact_db = ARTIFACTS_DIR / "articles.db"
-    shutil.copy(DB_PATH, artifact_db)
+    artifact_db.unlink(missing_ok=True)  # VACUUM INTO는 기존 파일에 쓰지 않음
+
+    src = conn if conn is not None else sqlite3.connect(DB_PATH)
+    try:
+        src.execute("VACUUM INTO ?", (str(artifact_db),))
+    finally:
+        if conn is None:
+            src.close()
 
     file_size = artifact_db.stat().st_size
     print(f"✅ Uploaded to: {artifact_db}")
     print(f"   Size: {file_size / 1024:.2f} KB")
     print(f"   Retention: 90 days (simulated)")
 
-    # 최종 DB 통계
-    show_db_stats(DB_PATH, "Final Database")
-
     return True
 
 
-def show_db_stats(db_path: Path, title: str = "Database"):
+def show_db_stats(
+    db_path: Path,
+    title: str = "Database",
+    conn: Optional[sqlite3.Connection] = None,
+    compare_to: Optional[Path] = None
+):
     """
     DB 통계 표시.
 
+    compare_to가 주어지면 해당 DB를 ATTACH 하여 이전/현재 비교까지
+    하나의 집계 쿼리로 조회합니다.
+
     Args:
         db_path: DB 파일 경로
         title: 제목
+        conn: 이미 열려 있는 연결 (None이면 새로 연결 후 닫음)
+        compare_to: 비교할 이전 DB 파일 경로
     """
     if not db_path.exists():
         print(f"ℹ️  {title}: No database yet")
         return
 
-    try:
-        import sqlite3
+    owns_connection = conn is None
 
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+    try:
+        if owns_connection:
+            conn = sqlite3.connect(db_path)
 
-        # 기사 통계
-        cursor.execute("""
+        # 기사 통계 (+ 이전 DB 기사 수)
+        query = """
             SELECT
                 COUNT(*) as total,
                 COUNT(CASE WHEN notified = 1 THEN 1 END) as notified,
                 COUNT(CASE WHEN notified = 0 THEN 1 END) as pending
-            FROM articles
-        """)
+                {previous}
+            FROM main.articles
+        """
+        if compare_to is not None:
+            conn.execute("ATTACH DATABASE ? AS prev", (str(compare_to),))
+            try:
+                stats = conn.execute(query.format(
+                    previous=", (SELECT COUNT(*) FROM prev.articles) as previous"
+                )).fetchone()
+            finally:
+                conn.execute("DETACH DATABASE prev")
+        else:
+            stats = conn.execute(query.format(previous="")).fetchone()
+
+        if compare_to is not None:
+            before_count, after_count = stats[3], stats[0]
+            new_articles = after_count - before_count
 
-        stats = cursor.fetchone()
+            print(f"📊 Before: {before_count} articles")
+            print(f"📊 After:  {after_count} articles")
+
+            if new_articles > 0:
+                print(f"✅ New articles added: {new_articles}")
+            elif new_articles == 0:
+                print("ℹ️  No new articles (all duplicates)")
+            else:
+                print(f"⚠️  Articles decreased: {abs(new_articles)}")
 
         print(f"\n📊 {title} Statistics:")
         print(f"   📚 Total articles: {stats[0]}")
         print(f"   ✉️  Notified: {stats[1]}")
         print(f"   🆕 Pending: {stats[2]}")
 
-        conn.close()
-
     except Exception as e:
         print(f"⚠️  Could not read stats: {e}")
 
+    finally:
+        if owns_connection and conn is not None:
+            conn.close()
+
 
 def run_main_program():
     """
@@ -145,9 +195,12 @@ def run_main_program():
         sys.exit(1)
 
 
-def show_comparison():
+def show_comparison(conn: Optional[sqlite3.Connection] = None):
     """
-    이전/현재 DB 비교.
+    이전/현재 DB 비교 및 최종 통계 표시.
+
+    Args:
+        conn: 현재 DB에 열려 있는 연결 (None이면 새로 연결 후 닫음)
     """
     print("\n" + "=" * 60)
     print("🔍 Comparison: Before vs After")
@@ -156,45 +209,16 @@ def show_comparison():
     artifact_db = ARTIFACTS_DIR / "articles.db"
     current_db = DB_PATH
 
-    if not artifact_db.exists():
-        print("ℹ️  No previous artifact to compare (first run)")
-        return
-
     if not current_db.exists():
         print("❌ Current database not found")
         return
 
-    try:
-        import sqlite3
-
-        # 이전 DB 통계
-        conn1 = sqlite3.connect(artifact_db)
-        cursor1 = conn1.cursor()
-        cursor1.execute("SELECT COUNT(*) FROM articles")
-        before_count = cursor1.fetchone()[0]
-        conn1.close()
-
-        # 현재 DB 통계
-        conn2 = sqlite3.connect(current_db)
-        cursor2 = conn2.cursor()
-        cursor2.execute("SELECT COUNT(*) FROM articles")
-        after_count = cursor2.fetchone()[0]
-        conn2.close()
-
-        new_articles = after_count - before_count
-
-        print(f"📊 Before: {before_count} articles")
-        print(f"📊 After:  {after_count} articles")
-
-        if new_articles > 0:
-            print(f"✅ New articles added: {new_articles}")
-        elif new_articles == 0:
-            print("ℹ️  No new articles (all duplicates)")
-        else:
-            print(f"⚠️  Articles decreased: {abs(new_articles)}")
+    if not artifact_db.exists():
+        print("ℹ️  No previous artifact to compare (first run)")
+        show_db_stats(current_db, "Final Database", conn=conn)
+        return
 
-    except Exception as e:
-        print(f"⚠️  Could not compare: {e}")
+    show_db_stats(current_db, "Final Database", conn=conn, compare_to=artifact_db)
 
 
 def cleanup():
@@ -238,11 +262,18 @@ def main():
     # Step 2: 메인 프로그램 실행 안내
     run_main_program()
 
-    # Step 2.5: 비교
-    show_comparison()
+    # 비교 및 최종 통계는 현재 DB에 대한 하나의 연결과 집계 쿼리를 공유
+    conn = sqlite3.connect(DB_PATH) if DB_PATH.exists() else None
 
-    # Step 3: Artifact 업로드
-    simulate_upload_artifact()
+    try:
+        # Step 2.5: 비교 및 최종 통계
+        show_comparison(conn)
+
+        # Step 3: Artifact 업로드
+        simulate_upload_artifact(conn)
+    finally:
+        if conn is not None:
+            conn.close()
 
     # 완료 메시지
     print("\n" + "=" * 60)
@@ -13,21 +13,36 @@ Exit Codes:
     1 - One or more validations failed
 """
 
+import ast
+import json
+import re
 import sys
 import os
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
-import yaml
-import subprocess
+from typing import List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# Parsed YAML documents keyed by path, invalidated by file (mtime_ns, size)
+_YAML_CACHE: Dict[Path, Tuple[List[int], Any]] = {}
 
 
 class ValidationResult:
     """Container for validation results."""
 
+    __slots__ = ("checks_passed", "failed_messages", "failed_details", "warnings", "progress")
+
     def __init__(self):
         self.checks_passed = []
-        self.checks_failed = []
+        # Failed checks as parallel message/details lists
+        self.failed_messages: List[str] = []
+        self.failed_details: List[Optional[str]] = []
         self.warnings = []
+        self.progress = []
+
+    def add_progress(self, message: str):
+        """Add a progress line, printed ahead of the summary."""
+        self.progress.append(message)
 
     def add_pass(self, message: str):
         """Add a passed check."""
@@ -35,72 +50,262 @@ class ValidationResult:
 
     def add_fail(self, message: str, details: str = None):
         """Add a failed check."""
-        self.checks_failed.append((message, details))
+        self.failed_messages.append(sys.intern(message))
+        self.failed_details.append(details)
 
     def add_warning(self, message: str):
         """Add a warning."""
         self.warnings.append(message)
 
+    def merge(self, other: "ValidationResult"):
+        """Append another result's checks and warnings to this one."""
+        self.checks_passed.extend(other.checks_passed)
+        self.failed_messages.extend(other.failed_messages)
+        self.failed_details.extend(other.failed_details)
+        self.warnings.extend(other.warnings)
+        self.progress.extend(other.progress)
+
     def is_success(self) -> bool:
         """Check if all validations passed."""
-        return len(self.checks_failed) == 0
+        return len(self.failed_messages) == 0
 
     def print_summary(self):
-        """Print validation summary."""
-        print("\n" + "=" * 70)
-        print("VALIDATION SUMMARY")
-        print("=" * 70)
+        """Print validation summary (progress lines first) with a single write."""
+        out = list(self.progress)
+        out.append("\n" + "=" * 70)
+        out.append("VALIDATION SUMMARY")
+        out.append("=" * 70)
 
         # Passed checks
         if self.checks_passed:
-            print(f"\n[PASS] {len(self.checks_passed)} checks passed:")
+            out.append(f"\n[PASS] {len(self.checks_passed)} checks passed:")
             for check in self.checks_passed:
-                print(f"   [+] {check}")
+                out.append(f"   [+] {check}")
 
         # Warnings
         if self.warnings:
-            print(f"\n[WARN] {len(self.warnings)} warnings:")
+            out.append(f"\n[WARN] {len(self.warnings)} warnings:")
             for warning in self.warnings:
-                print(f"   [!] {warning}")
+                out.append(f"   [!] {warning}")
 
         # Failed checks
-        if self.checks_failed:
-            print(f"\n[FAIL] {len(self.checks_failed)} checks failed:")
-            for check, details in self.checks_failed:
-                print(f"   [-] {check}")
+        if self.failed_messages:
+            out.append(f"\n[FAIL] {len(self.failed_messages)} checks failed:")
+            for check, details in zip(self.failed_messages, self.failed_details):
+                out.append(f"   [-] {check}")
                 if details:
-                    print(f"       Details: {details}")
+                    out.append(f"       Details: {details}")
 
         # Final result
-        print("\n" + "=" * 70)
+        out.append("\n" + "=" * 70)
         if self.is_success():
-            print("SUCCESS: ALL VALIDATIONS PASSED!")
-            print("Your project is ready for GitHub Actions deployment.")
-            print("\nNext steps:")
-            print("  1. Commit all files: git add . && git commit -m 'Setup GitHub Actions'")
-            print("  2. Create GitHub repository (if not exists)")
-            print("  3. Push to GitHub: git push origin main")
-            print("  4. Configure GitHub Secrets (see GITHUB_ACTIONS_SETUP.md)")
-            print("  5. Enable Actions in your GitHub repository")
+            out.append("SUCCESS: ALL VALIDATIONS PASSED!")
+            out.append("Your project is ready for GitHub Actions deployment.")
+            out.append("\nNext steps:")
+            out.append("  1. Commit all files: git add . && git commit -m 'Setup GitHub Actions'")
+            out.append("  2. Create GitHub repository (if not exists)")
+            out.append("  3. Push to GitHub: git push origin main")
+            out.append("  4. Configure GitHub Secrets (see GITHUB_ACTIONS_SETUP.md)")
+            out.append("  5. Enable Actions in your GitHub repository")
         else:
-            print("FAILED: VALIDATION FAILED")
-            print("Please fix the issues above before deploying to GitHub Actions.")
-            print("\nFor help, see: GITHUB_ACTIONS_SETUP.md")
-        print("=" * 70 + "\n")
+            out.append("FAILED: VALIDATION FAILED")
+            out.append("Please fix the issues above before deploying to GitHub Actions.")
+            out.append("\nFor help, see: GITHUB_ACTIONS_SETUP.md")
+        out.append("=" * 70 + "\n")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
 
 
+# Top-level keys every workflow must define (dict keeps check order)
+REQUIRED_WORKFLOW_KEYS = dict.fromkeys(['name', 'jobs'])
+
+# Patterns that must appear in .gitignore
+CRITICAL_GITIGNORE_PATTERNS = {
+    '.env': 'Environment files',
+    'data/': 'Data directory',
+    'logs/': 'Logs directory',
+    '*.db': 'Database files',
+    '.wdm/': 'ChromeDriver cache'
+}
+
+# Secrets that must be documented in GITHUB_ACTIONS_SETUP.md
+REQUIRED_SECRETS = [
+    'LOGIN_EMAIL',
+    'LOGIN_PASSWORD',
+    'EMAIL_FROM',
+    'EMAIL_PASSWORD',
+    'EMAIL_TO',
+    'SMTP_SERVER',
+    'SMTP_PORT'
+]
+
+
+def _alternation(literals) -> re.Pattern:
+    """
+    Compile literals into one regex that finds every occurrence in a single pass.
+
+    The lookahead keeps matches zero-width so overlapping literals
+    (e.g. '.env' inside '.env.example') are all reported, matching
+    the semantics of per-literal substring checks.
+    """
+    alternatives = b'|'.join(re.escape(literal.encode('utf-8')) for literal in literals)
+    return re.compile(b'(?=(' + alternatives + b'))')
+
+
+def _find_all(pattern: re.Pattern, content: bytes) -> set:
+    """Return the set of literals from the pattern found in raw file content."""
+    return {match.group(1).decode('utf-8') for match in pattern.finditer(content)}
+
+
+_GITIGNORE_RE = _alternation(CRITICAL_GITIGNORE_PATTERNS)
+_SECRETS_RE = _alternation(REQUIRED_SECRETS)
+
+
+# Directories (relative to the project root) whose files the validators check
+_SCANNED_DIRS = ('.', 'src', 'scripts', '.github/workflows')
+
+
+@lru_cache(maxsize=1)
+def _existing_files() -> frozenset:
+    """Collect project files with one directory read per scanned directory."""
+    project_root = get_project_root()
+    found = set()
+
+    for rel_dir in _SCANNED_DIRS:
+        try:
+            with os.scandir(project_root / rel_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        found.add(entry.name if rel_dir == '.' else f"{rel_dir}/{entry.name}")
+        except FileNotFoundError:
+            continue
+
+    return frozenset(found)
+
+
+def _file_exists(rel_path: str) -> bool:
+    """Check whether a project file exists, using the scanned file set."""
+    return rel_path in _existing_files()
+
+
+@lru_cache(maxsize=1)
+def _tracked_files() -> frozenset:
+    """
+    List git-tracked files once via a single `git ls-files -z` call.
+
+    Raises:
+        FileNotFoundError: If git is not installed
+    """
+    import subprocess
+
+    git_result = subprocess.run(
+        ['git', 'ls-files', '-z'],
+        cwd=get_project_root(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+
+    # Not a git repository (or git error): nothing is tracked
+    if git_result.returncode != 0:
+        return frozenset()
+
+    return frozenset(
+        path.decode('utf-8', 'surrogateescape')
+        for path in git_result.stdout.split(b'\0')
+        if path
+    )
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader():
+    """Use libyaml's C loader when available (falls back to the pure-Python SafeLoader)."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _json_cache_path(path: Path) -> Path:
+    """Path of the on-disk JSON cache for a YAML file (e.g. .config.yaml.cache.json)."""
+    return path.with_name(f".{path.name}.cache.json")
+
+
+def _write_json_cache(cache_path: Path, source: List[int], data: Any) -> None:
+    """
+    Store a parsed YAML document as JSON for faster loading on the next run.
+
+    Uses the same {"source": [mtime_ns, size], "data": ...} format as
+    Config, which reads the same sidecar for config.yaml. Written to a
+    temporary file and renamed into place, so a reader never sees a partial
+    cache. Documents JSON cannot represent faithfully (e.g. the workflow's
+    'on' key, which YAML parses as boolean True) are not cached.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        dumped = json.dumps({'source': source, 'data': data})
+        if json.loads(dumped)['data'] != data:
+            return
+        tmp_path.write_text(dumped, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except (TypeError, ValueError, OSError):
+        # Unserializable values or read-only checkout: just skip the cache
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """
+    Load a YAML file, reusing earlier parses while the file is unchanged.
+
+    Checks the in-process cache first, then a JSON cache file next to the
+    source, and only then parses YAML. Both caches are only used when they
+    were made from a file with exactly the current (mtime_ns, size), since
+    mtimes can go backwards (cp -p, tar, git checkout).
+    """
+    import yaml
+
+    stat = path.stat()
+    source = [stat.st_mtime_ns, stat.st_size]
+    hit = _YAML_CACHE.get(path)
+    if hit and hit[0] == source:
+        return hit[1]
+
+    cache_path = _json_cache_path(path)
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached['source'] == source:
+            data = cached['data']
+            _YAML_CACHE[path] = (source, data)
+            return data
+    except Exception:
+        # Missing, stale-format or corrupt cache: fall through to parsing the YAML
+        pass
+
+    # Binary mode lets libyaml handle the UTF-8 decoding itself
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_yaml_loader())
+
+    _YAML_CACHE[path] = (source, data)
+    _write_json_cache(cache_path, source, data)
+    return data
+
+
 def validate_workflow_yaml(result: ValidationResult) -> None:
     """Validate GitHub Actions workflow YAML file."""
-    print("\n[*] Checking GitHub Actions workflow configuration...")
+    import yaml
+
+    result.add_progress("\n[*] Checking GitHub Actions workflow configuration...")
 
     workflow_path = get_project_root() / ".github" / "workflows" / "monitor.yml"
 
-    if not workflow_path.exists():
+    if not _file_exists(".github/workflows/monitor.yml"):
         result.add_fail(
             "Workflow file not found",
             f"Expected: {workflow_path}"
@@ -108,19 +313,18 @@ def validate_workflow_yaml(result: ValidationResult) -> None:
         return
 
     try:
-        with open(workflow_path, 'r', encoding='utf-8') as f:
-            workflow_data = yaml.safe_load(f)
+        workflow_data = _load_yaml_cached(workflow_path)
 
-        # Check for required keys
+        # Check for required keys with one set difference over the top level
         # Note: 'on' is parsed as boolean True in YAML
-        required_keys = ['name', 'jobs']
-        for key in required_keys:
-            if key not in workflow_data:
-                result.add_fail(
-                    f"Workflow missing required key: {key}",
-                    f"File: {workflow_path}"
-                )
-                return
+        missing_keys = REQUIRED_WORKFLOW_KEYS.keys() - workflow_data.keys()
+        if missing_keys:
+            key = next(k for k in REQUIRED_WORKFLOW_KEYS if k in missing_keys)
+            result.add_fail(
+                f"Workflow missing required key: {key}",
+                f"File: {workflow_path}"
+            )
+            return
 
         # Check for 'on' key (may be parsed as True in YAML)
         if 'on' not in workflow_data and True not in workflow_data:
@@ -149,7 +353,6 @@ def validate_workflow_yaml(result: ValidationResult) -> None:
         jobs = workflow_data.get('jobs', {})
         if 'monitor' in jobs:
             steps = jobs['monitor'].get('steps', [])
-            step_names = [step.get('name', '') for step in steps]
 
             required_steps = [
                 'Checkout',
@@ -160,8 +363,18 @@ def validate_workflow_yaml(result: ValidationResult) -> None:
                 'monitoring'
             ]
 
+            # Single pass over the steps, stopping once every required step is seen
+            remaining = {required.lower(): required for required in required_steps}
+            for step in steps:
+                name = step.get('name', '').lower()
+                for required_lower in [r for r in remaining if r in name]:
+                    del remaining[required_lower]
+                if not remaining:
+                    break
+
+            missing_steps = set(remaining.values())
             for required in required_steps:
-                if any(required.lower() in name.lower() for name in step_names):
+                if required not in missing_steps:
                     result.add_pass(f"Workflow has {required} step")
                 else:
                     result.add_fail(
@@ -190,11 +403,11 @@ def validate_workflow_yaml(result: ValidationResult) -> None:
 
 def validate_gitignore(result: ValidationResult) -> None:
     """Validate .gitignore file."""
-    print("\n[*] Checking .gitignore configuration...")
+    result.add_progress("\n[*] Checking .gitignore configuration...")
 
     gitignore_path = get_project_root() / ".gitignore"
 
-    if not gitignore_path.exists():
+    if not _file_exists(".gitignore"):
         result.add_fail(
             ".gitignore file not found",
             "Critical security issue - secrets may be committed!"
@@ -202,20 +415,14 @@ def validate_gitignore(result: ValidationResult) -> None:
         return
 
     try:
-        with open(gitignore_path, 'r', encoding='utf-8') as f:
-            gitignore_content = f.read()
-
-        # Check for critical patterns
-        critical_patterns = {
-            '.env': 'Environment files',
-            'data/': 'Data directory',
-            'logs/': 'Logs directory',
-            '*.db': 'Database files',
-            '.wdm/': 'ChromeDriver cache'
-        }
-
-        for pattern, description in critical_patterns.items():
-            if pattern in gitignore_content:
+        # Raw bytes: substring checks don't need decoded text
+        gitignore_content = gitignore_path.read_bytes()
+
+        # Check for critical patterns (single scan over the file)
+        found = _find_all(_GITIGNORE_RE, gitignore_content)
+
+        for pattern, description in CRITICAL_GITIGNORE_PATTERNS.items():
+            if pattern in found:
                 result.add_pass(f".gitignore includes {description} ({pattern})")
             else:
                 result.add_fail(
@@ -224,7 +431,7 @@ def validate_gitignore(result: ValidationResult) -> None:
                 )
 
         # Check if .env.example is allowed
-        if '!.env.example' in gitignore_content or '.env.example' not in gitignore_content:
+        if b'!.env.example' in gitignore_content or b'.env.example' not in gitignore_content:
             result.add_pass(".env.example is allowed (good for documentation)")
 
     except Exception as e:
@@ -236,11 +443,13 @@ def validate_gitignore(result: ValidationResult) -> None:
 
 def validate_config_yaml(result: ValidationResult) -> None:
     """Validate config.yaml settings for GitHub Actions."""
-    print("\n[*] Checking config.yaml settings...")
+    import yaml
+
+    result.add_progress("\n[*] Checking config.yaml settings...")
 
     config_path = get_project_root() / "config.yaml"
 
-    if not config_path.exists():
+    if not _file_exists("config.yaml"):
         result.add_fail(
             "config.yaml not found",
             f"Expected: {config_path}"
@@ -248,8 +457,7 @@ def validate_config_yaml(result: ValidationResult) -> None:
         return
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml_cached(config_path)
 
         # Check scraping.headless is true
         headless = config_data.get('scraping', {}).get('headless', None)
@@ -306,22 +514,13 @@ def validate_config_yaml(result: ValidationResult) -> None:
 
 def validate_env_not_committed(result: ValidationResult) -> None:
     """Validate that .env file is not committed to git."""
-    print("\n[*] Checking that secrets are not committed...")
-
-    env_path = get_project_root() / ".env"
+    result.add_progress("\n[*] Checking that secrets are not committed...")
 
     # Check if .env exists
-    if env_path.exists():
+    if _file_exists(".env"):
         # Check if it's tracked by git
         try:
-            git_result = subprocess.run(
-                ['git', 'ls-files', '--error-unmatch', '.env'],
-                cwd=get_project_root(),
-                capture_output=True,
-                text=True
-            )
-
-            if git_result.returncode == 0:
+            if ".env" in _tracked_files():
                 result.add_fail(
                     ".env file is tracked by git!",
                     "CRITICAL: Remove it with 'git rm --cached .env'"
@@ -337,8 +536,7 @@ def validate_env_not_committed(result: ValidationResult) -> None:
         result.add_pass(".env file not found (will be created by GitHub Actions)")
 
     # Check if .env.example exists
-    env_example_path = get_project_root() / ".env.example"
-    if env_example_path.exists():
+    if _file_exists(".env.example"):
         result.add_pass(".env.example exists (good for documentation)")
     else:
         result.add_warning(".env.example not found - consider creating one")
@@ -346,11 +544,11 @@ def validate_env_not_committed(result: ValidationResult) -> None:
 
 def validate_secrets_documentation(result: ValidationResult) -> None:
     """Validate that secrets are properly documented."""
-    print("\n[*] Checking secrets documentation...")
+    result.add_progress("\n[*] Checking secrets documentation...")
 
     setup_doc_path = get_project_root() / "GITHUB_ACTIONS_SETUP.md"
 
-    if not setup_doc_path.exists():
+    if not _file_exists("GITHUB_ACTIONS_SETUP.md"):
         result.add_fail(
             "GITHUB_ACTIONS_SETUP.md not found",
             "Users need documentation to configure GitHub Secrets"
@@ -358,23 +556,14 @@ def validate_secrets_documentation(result: ValidationResult) -> None:
         return
 
     try:
-        with open(setup_doc_path, 'r', encoding='utf-8') as f:
-            doc_content = f.read()
-
-        # Check for required secrets documentation
-        required_secrets = [
-            'LOGIN_EMAIL',
-            'LOGIN_PASSWORD',
-            'EMAIL_FROM',
-            'EMAIL_PASSWORD',
-            'EMAIL_TO',
-            'SMTP_SERVER',
-            'SMTP_PORT'
-        ]
+        doc_content = setup_doc_path.read_bytes()
+
+        # Check for required secrets documentation (single scan over the doc)
+        documented = _find_all(_SECRETS_RE, doc_content)
 
         all_documented = True
-        for secret in required_secrets:
-            if secret in doc_content:
+        for secret in REQUIRED_SECRETS:
+            if secret in documented:
                 result.add_pass(f"Secret {secret} is documented")
             else:
                 result.add_fail(
@@ -394,58 +583,41 @@ def validate_secrets_documentation(result: ValidationResult) -> None:
 
 
 def validate_required_files(result: ValidationResult) -> None:
-    """Validate that all required files exist."""
-    print("\n[*] Checking required files...")
+    """Validate that all required files exist and Python files have valid syntax."""
+    result.add_progress("\n[*] Checking required files and Python syntax...")
 
+    # file path -> (description, also syntax-check)
     required_files = {
-        'requirements.txt': 'Python dependencies',
-        'config.yaml': 'Main configuration',
-        'main.py': 'Entry point',
-        'src/config.py': 'Config module',
-        'src/database.py': 'Database module',
-        'src/auth.py': 'Auth module',
-        'src/scraper.py': 'Scraper module',
-        'src/notifier.py': 'Notifier module',
-        '.github/workflows/monitor.yml': 'GitHub Actions workflow',
-        'GITHUB_ACTIONS_SETUP.md': 'Setup documentation'
+        'requirements.txt': ('Python dependencies', False),
+        'config.yaml': ('Main configuration', False),
+        'main.py': ('Entry point', True),
+        'src/config.py': ('Config module', True),
+        'src/database.py': ('Database module', True),
+        'src/auth.py': ('Auth module', True),
+        'src/scraper.py': ('Scraper module', True),
+        'src/notifier.py': ('Notifier module', True),
+        '.github/workflows/monitor.yml': ('GitHub Actions workflow', False),
+        'GITHUB_ACTIONS_SETUP.md': ('Setup documentation', False)
     }
 
     project_root = get_project_root()
 
-    for file_path, description in required_files.items():
-        full_path = project_root / file_path
-        if full_path.exists():
-            result.add_pass(f"{description} exists ({file_path})")
-        else:
+    for file_path, (description, check_syntax) in required_files.items():
+        if not _file_exists(file_path):
             result.add_fail(
                 f"Required file missing: {file_path}",
                 f"This file is needed for {description}"
             )
+            continue
 
+        result.add_pass(f"{description} exists ({file_path})")
 
-def validate_python_syntax(result: ValidationResult) -> None:
-    """Validate Python syntax of main files."""
-    print("\n[*] Checking Python syntax...")
-
-    python_files = [
-        'main.py',
-        'src/config.py',
-        'src/database.py',
-        'src/auth.py',
-        'src/scraper.py',
-        'src/notifier.py'
-    ]
-
-    project_root = get_project_root()
-
-    for file_path in python_files:
-        full_path = project_root / file_path
-        if not full_path.exists():
+        if not check_syntax:
             continue
 
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                compile(f.read(), file_path, 'exec')
+            # Syntax-only check: ast.parse skips bytecode generation
+            ast.parse((project_root / file_path).read_bytes(), filename=file_path)
             result.add_pass(f"Python syntax valid: {file_path}")
         except SyntaxError as e:
             result.add_fail(
@@ -465,14 +637,33 @@ def main():
 
     result = ValidationResult()
 
-    # Run all validation checks
-    validate_required_files(result)
-    validate_workflow_yaml(result)
-    validate_gitignore(result)
-    validate_config_yaml(result)
-    validate_env_not_committed(result)
-    validate_secrets_documentation(result)
-    validate_python_syntax(result)
+    if _yaml_loader().__name__ == "SafeLoader":
+        result.add_warning(
+            "libyaml not available - YAML parsing falls back to the slower pure-Python loader"
+        )
+
+    # Run all validation checks concurrently, each into its own result shard
+    validators = [
+        validate_required_files,
+        validate_workflow_yaml,
+        validate_gitignore,
+        validate_config_yaml,
+        validate_env_not_committed,
+        validate_secrets_documentation
+    ]
+    shards = [ValidationResult() for _ in validators]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(validator, shard)
+            for validator, shard in zip(validators, shards)
+        ]
+        for future in futures:
+            future.result()
+
+    # Merge in validator order so the summary stays deterministic
+    for shard in shards:
+        result.merge(shard)
 
     # Print summary
     result.print_summary()
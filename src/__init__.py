@@ -13,12 +13,17 @@ Modules:
 __version__ = "1.0.0"
 __author__ = "Gomu Monitor Team"
 
-# Package-level imports for convenience
-from .config import Config
-from .database import Database
-from .auth import Authenticator
-from .scraper import NewsScraper
-from .notifier import Notifier
+import importlib
+
+# Package-level imports for convenience, resolved lazily so that importing
+# one submodule doesn't load Selenium through the others
+_LAZY_IMPORTS = {
+    "Config": ".config",
+    "Database": ".database",
+    "Authenticator": ".auth",
+    "NewsScraper": ".scraper",
+    "Notifier": ".notifier",
+}
 
 __all__ = [
     "Config",
@@ -27,3 +32,13 @@ __all__ = [
     "NewsScraper",
     "Notifier"
 ]
+
+
+def __getattr__(name):
+    """Import package-level names on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,11 +9,16 @@ Features:
 - Auto-retry on failure
 """
 
+import os
+import json
 import logging
+import random
 import time
-import pickle
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from selenium import webdriver
@@ -28,12 +33,130 @@ from selenium.common.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Resources not needed to render the login form
+_LOGIN_BLOCKED_URLS = ('*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.woff*', '*.ttf', '*.css')
+
+# Saved session data by session file path, mirroring what is on disk
+_SESSION_CACHE: Dict[Path, Dict[str, Any]] = {}
+
+# Cookie fields accepted by WebDriver's add_cookie
+_COOKIE_KEYS = frozenset({
+    'name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite'
+})
+
+# Fallback locators for the login form, tried in order: (By, selector)
+_EMAIL_SELECTORS = (
+    # gomuhouchi.com specific (SWPM plugin)
+    (By.CSS_SELECTOR, 'input[name="swpm_user_name"]'),
+    (By.CSS_SELECTOR, 'input[id="swpm_user_name"]'),
+    # Common selectors
+    (By.CSS_SELECTOR, 'input[type="email"]'),
+    (By.CSS_SELECTOR, 'input[name="email"]'),
+    (By.CSS_SELECTOR, 'input[name="username"]'),
+    (By.CSS_SELECTOR, 'input[id="email"]'),
+    (By.CSS_SELECTOR, 'input[id="username"]'),
+    (By.CSS_SELECTOR, 'input[placeholder*="メール"]'),  # Japanese "email"
+)
+
+_PASSWORD_SELECTORS = (
+    # gomuhouchi.com specific (SWPM plugin)
+    (By.CSS_SELECTOR, 'input[name="swpm_password"]'),
+    (By.CSS_SELECTOR, 'input[id="swpm_password"]'),
+    # Common selectors
+    (By.CSS_SELECTOR, 'input[type="password"]'),
+    (By.CSS_SELECTOR, 'input[name="password"]'),
+    (By.CSS_SELECTOR, 'input[id="password"]'),
+    (By.CSS_SELECTOR, 'input[placeholder*="パスワード"]'),  # Japanese "password"
+)
+
+_SUBMIT_SELECTORS = (
+    # gomuhouchi.com specific (SWPM plugin)
+    (By.CSS_SELECTOR, 'input[name="swpm-login"]'),
+    (By.CSS_SELECTOR, 'input[type="submit"][name="swpm-login"]'),
+    (By.CSS_SELECTOR, '.swpm-login-form-submit'),
+    # Common selectors
+    (By.CSS_SELECTOR, 'button[type="submit"]'),
+    (By.CSS_SELECTOR, 'input[type="submit"]'),
+    (By.CSS_SELECTOR, 'a.login-button'),
+    # Text matches (CSS has no :contains, so these use XPath)
+    (By.XPATH, '//button[contains(normalize-space(.), "ログイン")]'),  # Japanese "login"
+    (By.XPATH, '//button[contains(normalize-space(.), "Login")]'),
+)
+
+# Locators indicating a logged-in page
+_LOGIN_INDICATORS = (
+    (By.CSS_SELECTOR, 'a[href*="logout"]'),
+    (By.CSS_SELECTOR, '.user-menu'),
+    (By.CSS_SELECTOR, '.profile-menu'),
+    (By.CSS_SELECTOR, '#user-profile'),
+    (By.XPATH, '//button[contains(normalize-space(.), "ログアウト")]'),  # Japanese "logout"
+)
+
+_LOGOUT_SELECTORS = (
+    (By.CSS_SELECTOR, 'a[href*="logout"]'),
+    (By.CSS_SELECTOR, '.logout-button'),
+    (By.XPATH, '//button[contains(normalize-space(.), "ログアウト")]'),
+)
+
+
+@lru_cache(maxsize=None)
+def _partition_locators(locators: tuple) -> Tuple[str, tuple]:
+    """
+    Split locators into one CSS selector group and the remaining (XPath, etc.) locators.
+
+    Cached per locator tuple, so the split happens once per selector set.
+    Native CSS has no jQuery-style :contains(), so text matches must be XPath.
+
+    Args:
+        locators: Tuple of (By, selector) pairs
+
+    Returns:
+        Tuple of (comma-joined CSS selectors, non-CSS locators)
+    """
+    css_group = ", ".join(selector for by, selector in locators if by == By.CSS_SELECTOR)
+    others = tuple((by, selector) for by, selector in locators if by != By.CSS_SELECTOR)
+    return css_group, others
+
+
+# Sets both credential fields and fires input/change events so form scripts see the values
+_FILL_CREDENTIALS_JS = """
+const [email, password, emailValue, passwordValue] = arguments;
+email.value = emailValue;
+password.value = passwordValue;
+for (const el of [email, password]) {
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+# Serializes login page form elements for debug_login_page in one script call
+_DEBUG_COLLECT_JS = """
+const collect = (selector, fields) => [...document.querySelectorAll(selector)].map(
+    el => Object.fromEntries(fields.map(field => [field, (
+        field === 'class' ? el.getAttribute('class') :
+        field === 'text' ? el.innerText :
+        (el[field] ?? el.getAttribute(field))
+    )]))
+);
+return {
+    inputs: collect('input', ['type', 'name', 'id', 'class', 'placeholder', 'value']),
+    buttons: collect('button', ['type', 'name', 'id', 'class', 'text']),
+    submits: collect("input[type='submit']", ['name', 'id', 'value', 'class']),
+    forms: collect('form', ['action', 'method', 'id', 'class'])
+};
+"""
+
 
 class AuthenticationError(Exception):
     """Custom exception for authentication failures."""
     pass
 
 
+class InvalidCredentialsError(AuthenticationError):
+    """Login form rejected the credentials; retrying cannot succeed."""
+    pass
+
+
 class Authenticator:
     """
     Handles website authentication and session management.
@@ -58,8 +181,45 @@ class Authenticator:
         """
         self.config = config
         self.driver = driver
-        self.session_file = Path("data/session.pkl")
+        self.session_file = Path("data/session.json")
+        self._session_dir_ready = False
         self.is_authenticated = False
+        self._authenticated_at: Optional[datetime] = None
+
+        # Settings used on every login attempt, resolved once
+        self._login_url = self.config.login_url
+        self._site_url = self.config.site_url
+        self._site_host = (urlparse(self._site_url).hostname or '').lower()
+        self._email_selector = self.config.get(
+            'site.login_form_selectors.email_field', 'input[type="email"]'
+        )
+        self._password_selector = self.config.get(
+            'site.login_form_selectors.password_field', 'input[type="password"]'
+        )
+        self._session_max_age = timedelta(
+            hours=self.config.get('scraping.session_cookie_lifetime_hours', 24)
+        )
+
+        self._block_assets = self.config.get('scraping.block_assets_for_login', True)
+
+        # URL fragments that confirm a logged-in page without DOM probing
+        self._loggedin_patterns = tuple(
+            pattern.lower()
+            for pattern in (self.config.get('site.logged_in_url_patterns', []) or [])
+        )
+
+        # Error message shown by the login form on rejected credentials
+        self._login_error_selector = self.config.get(
+            'site.login_form_selectors.error_message',
+            '.swpm-login-error-msg, .login-error'
+        )
+
+        # Login form locators that matched on a previous attempt (reused on retries)
+        self._resolved_selectors: Dict[str, tuple] = {}
+
+        # Let chromedriver poll for elements in-browser instead of client-side retries
+        self.implicit_wait = self.config.get('scraping.implicit_wait_s', 10)
+        self.driver.implicitly_wait(self.implicit_wait)
 
         # Validate credentials
         if not self.config.login_email or not self.config.login_password:
@@ -83,11 +243,34 @@ class Authenticator:
             >>> if auth.login():
             ...     print("Login successful")
         """
+        # Same browser as an earlier successful login: its cookies are still loaded
+        if self._is_warm_session() and self._validate_session():
+            logger.info("Reusing authenticated browser session")
+            return True
+        self.is_authenticated = False
+
+        # Login pages only need HTML and scripts: skip images, fonts and CSS
+        with self._blocked_assets():
+            return self._restore_or_login(max_retries)
+
+    def _restore_or_login(self, max_retries: int) -> bool:
+        """
+        Restore the saved session, or perform a fresh login with retries.
+
+        Args:
+            max_retries: Maximum number of login attempts
+
+        Returns:
+            bool: True if login successful
+
+        Raises:
+            AuthenticationError: If login fails after all retries
+        """
         # Check if we have valid session cookies
         if self._load_session():
             logger.info("Restored session from cookies")
             if self._validate_session():
-                self.is_authenticated = True
+                self._mark_authenticated()
                 return True
             else:
                 logger.info("Saved session invalid, performing fresh login")
@@ -100,19 +283,70 @@ class Authenticator:
 
                 if self._validate_session():
                     self._save_session()
-                    self.is_authenticated = True
+                    self._mark_authenticated()
                     logger.info("Login successful")
                     return True
                 else:
                     logger.warning(f"Login validation failed on attempt {attempt}")
 
+            except InvalidCredentialsError as e:
+                logger.error(f"Login rejected, not retrying: {e}")
+                raise
+
             except Exception as e:
                 logger.error(f"Login attempt {attempt} failed: {e}")
                 if attempt < max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    # Capped exponential backoff with full jitter
+                    time.sleep(random.uniform(0, min(2 ** attempt, 10)))
 
         raise AuthenticationError(f"Login failed after {max_retries} attempts")
 
+    @contextmanager
+    def _blocked_assets(self):
+        """
+        Block image, font and stylesheet requests while logging in.
+
+        Uses Chrome DevTools `Network.setBlockedURLs`; the block list is cleared
+        on exit so later scraping loads pages normally. No-op when disabled via
+        `scraping.block_assets_for_login` or on drivers without CDP support.
+        """
+        if not self._block_assets:
+            yield
+            return
+
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_LOGIN_BLOCKED_URLS)})
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"Asset blocking unavailable: {e}")
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            try:
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+            except WebDriverException as e:
+                logger.warning(f"Could not clear blocked URLs: {e}")
+
+    def _mark_authenticated(self) -> None:
+        """Record a successful login for reuse by later login() calls."""
+        self.is_authenticated = True
+        self._authenticated_at = datetime.now()
+
+    def _is_warm_session(self) -> bool:
+        """
+        Check whether this browser logged in recently enough to skip restoring cookies.
+
+        Returns:
+            bool: True if authenticated within the session cookie lifetime
+        """
+        if not self.is_authenticated or self._authenticated_at is None:
+            return False
+
+        return datetime.now() - self._authenticated_at <= self._session_max_age
+
     def _perform_login(self) -> None:
         """
         Execute the login process.
@@ -123,56 +357,170 @@ class Authenticator:
         Raises:
             TimeoutException: If login page elements not found
             NoSuchElementException: If form fields not found
+            InvalidCredentialsError: If the login form reports an error
         """
         try:
-            # Navigate to login page
-            login_url = self.config.login_url
-            logger.debug(f"Navigating to login page: {login_url}")
-            self.driver.get(login_url)
+            login_url = self._login_url
+            resolved = self._resolved_selectors
 
-            # Wait for page to load
-            wait = WebDriverWait(self.driver, 10)
+            # Retry on the same page: refresh instead of a full navigation
+            if resolved and self.driver.current_url == login_url:
+                logger.debug("Refreshing login page for retry")
+                self.driver.refresh()
+            else:
+                logger.debug(f"Navigating to login page: {login_url}")
+                self.driver.get(login_url)
 
-            # Try to find login form elements
-            # Method 1: Using configured selectors
-            try:
-                email_field = wait.until(
-                    EC.presence_of_element_located((
-                        By.CSS_SELECTOR,
-                        self.config.get('site.login_form_selectors.email_field', 'input[type="email"]')
-                    ))
-                )
-                password_field = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    self.config.get('site.login_form_selectors.password_field', 'input[type="password"]')
-                )
-
-            # Method 2: Fallback to common field names
-            except (TimeoutException, NoSuchElementException):
-                logger.debug("Trying fallback selectors for login form")
-                email_field = self._find_email_field()
-                password_field = self._find_password_field()
+            # Try to find login form elements (implicit wait covers page load)
+            if resolved:
+                # Method 0: Locators that matched on the previous attempt
+                email_field = self._find_resolved('email')
+                password_field = self._find_resolved('password')
+
+            else:
+                email_locators = ((By.CSS_SELECTOR, self._email_selector),)
+                password_locators = ((By.CSS_SELECTOR, self._password_selector),)
+
+                # Method 1: Using configured selectors
+                try:
+                    email_field = self.driver.find_element(*email_locators[0])
+                    password_field = self.driver.find_element(*password_locators[0])
+
+                # Method 2: Fallback to common field names
+                except NoSuchElementException:
+                    logger.debug("Trying fallback selectors for login form")
+                    email_field = self._find_email_field()
+                    password_field = self._find_password_field()
+                    email_locators = _EMAIL_SELECTORS
+                    password_locators = _PASSWORD_SELECTORS
+
+                resolved['email'] = email_locators
+                resolved['password'] = password_locators
 
             # Fill in credentials
             logger.debug("Filling in login credentials")
-            email_field.clear()
-            email_field.send_keys(self.config.login_email)
-
-            password_field.clear()
-            password_field.send_keys(self.config.login_password)
+            self._fill_credentials(email_field, password_field)
 
             # Find and click submit button
             submit_button = self._find_submit_button()
             logger.debug("Submitting login form")
+            pre_url = self.driver.current_url
             submit_button.click()
 
-            # Wait for navigation after login
-            time.sleep(3)
+            # Wait for navigation after login (returns as soon as the page changes)
+            try:
+                with self._no_implicit_wait():
+                    WebDriverWait(self.driver, 10).until(
+                        lambda d: d.current_url != pre_url
+                        or self._find_first(_LOGIN_INDICATORS) is not None
+                    )
+            except TimeoutException:
+                logger.debug("No navigation detected after login submit")
+
+            # A login error message means the credentials were rejected
+            if self.driver.current_url == pre_url:
+                with self._no_implicit_wait():
+                    error_messages = self.driver.find_elements(
+                        By.CSS_SELECTOR, self._login_error_selector
+                    )
+                if error_messages:
+                    raise InvalidCredentialsError(
+                        f"Login form reported an error: {error_messages[0].text.strip()}"
+                    )
 
         except Exception as e:
+            # Form may have changed: resolve selectors from scratch next time
+            self._resolved_selectors.clear()
             logger.error(f"Error during login process: {e}")
             raise
 
+    def _fill_credentials(self, email_field, password_field) -> None:
+        """
+        Fill both login fields in a single script call.
+
+        Falls back to clear() + send_keys() if the script cannot run.
+
+        Args:
+            email_field: Email input element
+            password_field: Password input element
+        """
+        try:
+            self.driver.execute_script(
+                _FILL_CREDENTIALS_JS,
+                email_field,
+                password_field,
+                self.config.login_email,
+                self.config.login_password
+            )
+            return
+        except WebDriverException as e:
+            logger.debug(f"Script fill failed, typing credentials instead: {e}")
+
+        email_field.clear()
+        email_field.send_keys(self.config.login_email)
+
+        password_field.clear()
+        password_field.send_keys(self.config.login_password)
+
+    def _find_resolved(self, field: str):
+        """
+        Find a login form field using the locators resolved on a previous attempt.
+
+        Args:
+            field: Field key ('email' or 'password')
+
+        Returns:
+            WebElement: Form field
+
+        Raises:
+            NoSuchElementException: If the cached locators no longer match
+        """
+        element = self._find_first(self._resolved_selectors[field])
+        if element is None:
+            raise NoSuchElementException(f"Cached {field} selector no longer matches")
+        return element
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the implicit wait.
+
+        Used around lookups for elements that may legitimately be absent,
+        so each miss returns immediately instead of waiting the full timeout.
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+
+    def _find_first(self, locators):
+        """
+        Find the first element matching any of the given locators.
+
+        All CSS selectors are probed together as one selector group, so the
+        common case costs a single WebDriver round-trip; XPath locators are
+        only tried when no CSS selector matched.
+
+        Args:
+            locators: Sequence of (By, selector) pairs
+
+        Returns:
+            WebElement or None if nothing matched
+        """
+        css_group, other_locators = _partition_locators(locators)
+        if css_group:
+            hits = self.driver.find_elements(By.CSS_SELECTOR, css_group)
+            if hits:
+                return hits[0]
+
+        for by, selector in other_locators:
+            hits = self.driver.find_elements(by, selector)
+            if hits:
+                return hits[0]
+
+        return None
+
     def _find_email_field(self):
         """
         Find email input field using multiple strategies.
@@ -183,26 +531,10 @@ class Authenticator:
         Raises:
             NoSuchElementException: If email field not found
         """
-        selectors = [
-            # gomuhouchi.com specific (SWPM plugin)
-            'input[name="swpm_user_name"]',
-            'input[id="swpm_user_name"]',
-            # Common selectors
-            'input[type="email"]',
-            'input[name="email"]',
-            'input[name="username"]',
-            'input[id="email"]',
-            'input[id="username"]',
-            'input[placeholder*="メール"]',  # Japanese "email"
-        ]
-
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                logger.debug(f"Found email field with selector: {selector}")
-                return element
-            except NoSuchElementException:
-                continue
+        element = self._find_first(_EMAIL_SELECTORS)
+        if element is not None:
+            logger.debug("Found email field via fallback selectors")
+            return element
 
         raise NoSuchElementException("Could not find email input field")
 
@@ -216,24 +548,10 @@ class Authenticator:
         Raises:
             NoSuchElementException: If password field not found
         """
-        selectors = [
-            # gomuhouchi.com specific (SWPM plugin)
-            'input[name="swpm_password"]',
-            'input[id="swpm_password"]',
-            # Common selectors
-            'input[type="password"]',
-            'input[name="password"]',
-            'input[id="password"]',
-            'input[placeholder*="パスワード"]',  # Japanese "password"
-        ]
-
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                logger.debug(f"Found password field with selector: {selector}")
-                return element
-            except NoSuchElementException:
-                continue
+        element = self._find_first(_PASSWORD_SELECTORS)
+        if element is not None:
+            logger.debug("Found password field via fallback selectors")
+            return element
 
         raise NoSuchElementException("Could not find password input field")
 
@@ -247,26 +565,10 @@ class Authenticator:
         Raises:
             NoSuchElementException: If submit button not found
         """
-        selectors = [
-            # gomuhouchi.com specific (SWPM plugin)
-            'input[name="swpm-login"]',
-            'input[type="submit"][name="swpm-login"]',
-            '.swpm-login-form-submit',
-            # Common selectors
-            'button[type="submit"]',
-            'input[type="submit"]',
-            'button:contains("ログイン")',  # Japanese "login"
-            'button:contains("Login")',
-            'a.login-button',
-        ]
-
-        for selector in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                logger.debug(f"Found submit button with selector: {selector}")
-                return element
-            except NoSuchElementException:
-                continue
+        element = self._find_first(_SUBMIT_SELECTORS)
+        if element is not None:
+            logger.debug("Found submit button via fallback selectors")
+            return element
 
         # Fallback: Find any button or submit input
         try:
@@ -290,26 +592,23 @@ class Authenticator:
         """
         try:
             # Check if we're still on login page (bad sign)
-            if "login" in self.driver.current_url.lower():
+            current_url = self.driver.current_url.lower()
+            if "login" in current_url:
                 logger.debug("Still on login page after login attempt")
                 return False
 
+            # Known logged-in URL: conclusive without any DOM queries
+            if any(pattern in current_url for pattern in self._loggedin_patterns):
+                logger.debug("Current URL matches a logged-in pattern")
+                return True
+
             # Check for common logged-in indicators
-            logged_in_indicators = [
-                'a[href*="logout"]',
-                'button:contains("ログアウト")',  # Japanese "logout"
-                '.user-menu',
-                '.profile-menu',
-                '#user-profile',
-            ]
-
-            for selector in logged_in_indicators:
-                try:
-                    self.driver.find_element(By.CSS_SELECTOR, selector)
-                    logger.debug(f"Found logged-in indicator: {selector}")
-                    return True
-                except NoSuchElementException:
-                    continue
+            with self._no_implicit_wait():
+                indicator = self._find_first(_LOGIN_INDICATORS)
+
+            if indicator is not None:
+                logger.debug("Found logged-in indicator")
+                return True
 
             # If no indicators found, assume success if not on login page
             logger.debug("No explicit logged-in indicators found, assuming success")
@@ -327,22 +626,57 @@ class Authenticator:
         """
         try:
             cookies = self.driver.get_cookies()
-            self.session_file.parent.mkdir(parents=True, exist_ok=True)
+            if not self._session_dir_ready:
+                self.session_file.parent.mkdir(parents=True, exist_ok=True)
+                self._session_dir_ready = True
 
             session_data = {
                 'cookies': cookies,
-                'timestamp': datetime.now(),
+                'timestamp': datetime.now().isoformat(),
                 'url': self.driver.current_url
             }
 
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(session_data, f)
+            # Write to a temp file and rename, so a crash never leaves a partial session
+            tmp_file = self.session_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(session_data, f)
+            os.replace(tmp_file, self.session_file)
+            _SESSION_CACHE[self.session_file] = session_data
 
             logger.info(f"Session saved to {self.session_file}")
 
         except Exception as e:
             logger.error(f"Failed to save session: {e}")
 
+    def _read_session_data(self) -> Optional[Dict[str, Any]]:
+        """
+        Read saved session data, from the in-process cache when available.
+
+        Returns:
+            Session data dict, or None if there is no usable session file
+        """
+        session_data = _SESSION_CACHE.get(self.session_file)
+        if session_data is not None:
+            return session_data
+
+        try:
+            file_mtime = self.session_file.stat().st_mtime
+        except FileNotFoundError:
+            logger.debug("No saved session file found")
+            return None
+
+        # Cheap pre-check: a file last written before max_age can't hold a fresh session
+        file_age = datetime.now() - datetime.fromtimestamp(file_mtime)
+        if file_age > self._session_max_age:
+            logger.info(f"Saved session expired ({file_age.total_seconds() / 3600:.1f}h old)")
+            return None
+
+        with open(self.session_file, 'r', encoding='utf-8') as f:
+            session_data = json.load(f)
+
+        _SESSION_CACHE[self.session_file] = session_data
+        return session_data
+
     def _load_session(self) -> bool:
         """
         Load previously saved session cookies.
@@ -350,32 +684,28 @@ class Authenticator:
         Returns:
             bool: True if session loaded successfully, False otherwise
         """
-        if not self.session_file.exists():
-            logger.debug("No saved session file found")
-            return False
-
         try:
-            with open(self.session_file, 'rb') as f:
-                session_data = pickle.load(f)
+            max_age = self._session_max_age
+
+            session_data = self._read_session_data()
+            if session_data is None:
+                return False
 
             # Check if session is not too old (24 hours by default)
-            session_age = datetime.now() - session_data['timestamp']
-            max_age = timedelta(hours=self.config.get('scraping.session_cookie_lifetime_hours', 24))
+            session_age = datetime.now() - datetime.fromisoformat(session_data['timestamp'])
 
             if session_age > max_age:
                 logger.info(f"Saved session expired ({session_age.total_seconds() / 3600:.1f}h old)")
                 return False
 
             # Navigate to the site first
-            self.driver.get(self.config.site_url)
-            time.sleep(1)
+            self.driver.get(self._site_url)
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
 
             # Load cookies
-            for cookie in session_data['cookies']:
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception as e:
-                    logger.debug(f"Could not add cookie: {e}")
+            self._restore_cookies(session_data['cookies'])
 
             logger.info("Session cookies loaded")
             return True
@@ -384,6 +714,57 @@ class Authenticator:
             logger.error(f"Failed to load session: {e}")
             return False
 
+    def _restore_cookies(self, cookies) -> None:
+        """
+        Add saved cookies to the browser.
+
+        Cookies are validated up front (known fields only, no empty values,
+        domain matching the site) so none of them is rejected by the driver.
+        Uses one Chrome DevTools `Network.setCookies` call for the whole batch,
+        falling back to per-cookie `add_cookie` on drivers without CDP support.
+
+        Args:
+            cookies: Cookie dicts as returned by driver.get_cookies()
+        """
+        host = self._site_host
+
+        clean_cookies = []
+        for cookie in cookies:
+            clean = {
+                key: value for key, value in cookie.items()
+                if key in _COOKIE_KEYS and value is not None
+            }
+            if 'name' not in clean or 'value' not in clean:
+                continue
+
+            domain = clean.get('domain', '').lstrip('.').lower()
+            if domain and host != domain and not host.endswith('.' + domain):
+                continue
+
+            clean_cookies.append(clean)
+
+        skipped = len(cookies) - len(clean_cookies)
+        if skipped:
+            logger.debug(f"Skipped {skipped} cookies not applicable to {host}")
+
+        cdp_cookies = []
+        for cookie in clean_cookies:
+            cdp_cookie = {key: value for key, value in cookie.items() if key != 'expiry'}
+            if 'expiry' in cookie:
+                cdp_cookie['expires'] = cookie['expiry']
+            if not cdp_cookie.get('domain'):
+                cdp_cookie['url'] = self._site_url
+            cdp_cookies.append(cdp_cookie)
+
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            return
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"CDP cookie restore unavailable, adding cookies one by one: {e}")
+
+        for cookie in clean_cookies:
+            self.driver.add_cookie(cookie)
+
     def logout(self) -> None:
         """
         Log out from the website and clear session.
@@ -393,26 +774,17 @@ class Authenticator:
         """
         try:
             # Try to find and click logout button
-            logout_selectors = [
-                'a[href*="logout"]',
-                'button:contains("ログアウト")',
-                '.logout-button',
-            ]
-
-            for selector in logout_selectors:
-                try:
-                    logout_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    logout_btn.click()
-                    logger.info("Logged out successfully")
-                    break
-                except NoSuchElementException:
-                    continue
+            logout_btn = self._find_first(_LOGOUT_SELECTORS)
+            if logout_btn is not None:
+                logout_btn.click()
+                logger.info("Logged out successfully")
 
         except Exception as e:
             logger.warning(f"Logout attempt failed: {e}")
 
         finally:
             # Clear session file
+            _SESSION_CACHE.pop(self.session_file, None)
             if self.session_file.exists():
                 self.session_file.unlink()
                 logger.debug("Session file deleted")
@@ -436,8 +808,6 @@ class Authenticator:
             >>> debug_info = auth.debug_login_page()
             >>> print(debug_info['input_fields'])
         """
-        from pathlib import Path
-
         debug_info = {
             'url': self.config.login_url,
             'input_fields': [],
@@ -452,83 +822,46 @@ class Authenticator:
             self.driver.get(self.config.login_url)
             time.sleep(2)  # Wait for page to load
 
-            # Find all input fields
-            inputs = self.driver.find_elements(By.TAG_NAME, "input")
-            logger.info(f"Found {len(inputs)} input fields")
-
-            for inp in inputs:
-                field_info = {
-                    'type': inp.get_attribute('type'),
-                    'name': inp.get_attribute('name'),
-                    'id': inp.get_attribute('id'),
-                    'class': inp.get_attribute('class'),
-                    'placeholder': inp.get_attribute('placeholder'),
-                    'value': inp.get_attribute('value')
-                }
-                debug_info['input_fields'].append(field_info)
+            # Collect all form-related elements in a single WebDriver round-trip
+            page_elements = self.driver.execute_script(_DEBUG_COLLECT_JS)
 
+            debug_info['input_fields'] = page_elements['inputs']
+            debug_info['buttons'] = page_elements['buttons']
+            debug_info['submit_buttons'] = page_elements['submits']
+            debug_info['forms'] = page_elements['forms']
+
+            logger.info(f"Found {len(debug_info['input_fields'])} input fields")
+            for field_info in debug_info['input_fields']:
                 print(f"Input: type={field_info['type']}, "
                       f"name={field_info['name']}, "
                       f"id={field_info['id']}, "
                       f"class={field_info['class']}, "
                       f"placeholder={field_info['placeholder']}")
 
-            # Find all buttons
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            logger.info(f"Found {len(buttons)} buttons")
-
-            for btn in buttons:
-                button_info = {
-                    'type': btn.get_attribute('type'),
-                    'name': btn.get_attribute('name'),
-                    'id': btn.get_attribute('id'),
-                    'class': btn.get_attribute('class'),
-                    'text': btn.text
-                }
-                debug_info['buttons'].append(button_info)
-
+            logger.info(f"Found {len(debug_info['buttons'])} buttons")
+            for button_info in debug_info['buttons']:
                 print(f"Button: type={button_info['type']}, "
                       f"name={button_info['name']}, "
                       f"id={button_info['id']}, "
                       f"text={button_info['text']}")
 
-            # Find submit inputs
-            submits = self.driver.find_elements(By.CSS_SELECTOR, "input[type='submit']")
-            logger.info(f"Found {len(submits)} submit inputs")
-
-            for sub in submits:
-                submit_info = {
-                    'name': sub.get_attribute('name'),
-                    'id': sub.get_attribute('id'),
-                    'value': sub.get_attribute('value'),
-                    'class': sub.get_attribute('class')
-                }
-                debug_info['submit_buttons'].append(submit_info)
-
+            logger.info(f"Found {len(debug_info['submit_buttons'])} submit inputs")
+            for submit_info in debug_info['submit_buttons']:
                 print(f"Submit: name={submit_info['name']}, "
                       f"id={submit_info['id']}, "
                       f"value={submit_info['value']}")
 
-            # Find forms
-            forms = self.driver.find_elements(By.TAG_NAME, "form")
-            logger.info(f"Found {len(forms)} forms")
-
-            for form in forms:
-                form_info = {
-                    'action': form.get_attribute('action'),
-                    'method': form.get_attribute('method'),
-                    'id': form.get_attribute('id'),
-                    'class': form.get_attribute('class')
-                }
-                debug_info['forms'].append(form_info)
-
+            logger.info(f"Found {len(debug_info['forms'])} forms")
+            for form_info in debug_info['forms']:
                 print(f"Form: action={form_info['action']}, "
                       f"method={form_info['method']}, "
                       f"id={form_info['id']}")
 
             # Save full HTML
-            output_path = Path(output_dir) / "login_page_debug.html"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            out_dir = Path(output_dir)
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            output_path = out_dir / "login_page_debug.html"
 
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(self.driver.page_source)
@@ -536,17 +869,21 @@ class Authenticator:
             logger.info(f"HTML saved to: {output_path}")
             print(f"\n✓ Full HTML saved to: {output_path}")
 
-            # Save debug info as JSON
-            import json
-            json_path = Path(output_dir) / "login_debug_info.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(debug_info, f, indent=2, ensure_ascii=False)
+            # Save debug info as JSON (orjson if available)
+            json_path = out_dir / "login_debug_info.json"
+            try:
+                import orjson
+                with open(json_path, "wb") as f:
+                    f.write(orjson.dumps(debug_info, option=orjson.OPT_INDENT_2))
+            except ImportError:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(debug_info, f, indent=2, ensure_ascii=False)
 
             logger.info(f"Debug info saved to: {json_path}")
             print(f"✓ Debug info saved to: {json_path}")
 
             # Take screenshot
-            screenshot_path = Path(output_dir) / "login_page_screenshot.png"
+            screenshot_path = out_dir / "login_page_screenshot.png"
             self.driver.save_screenshot(str(screenshot_path))
             logger.info(f"Screenshot saved to: {screenshot_path}")
             print(f"✓ Screenshot saved to: {screenshot_path}")
@@ -9,15 +9,39 @@ This module handles loading and managing configuration from:
 Environment variables take precedence over config.yaml values.
 """
 
+import json
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 import logging
+from functools import cached_property
+
+# Use the LibYAML C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Environment variables read by Config (snapshotted on construction)
+ENV_VARS = (
+    'LOGIN_EMAIL',
+    'LOGIN_PASSWORD',
+    'SMTP_SERVER',
+    'SMTP_PORT',
+    'EMAIL_FROM',
+    'EMAIL_PASSWORD',
+    'EMAIL_TO',
+    'TELEGRAM_BOT_TOKEN',
+    'TELEGRAM_CHAT_ID',
+)
+
+# Set once .env has been read, so later Config instances skip the file
+_DOTENV_LOADED = False
+
 
 class Config:
     """
@@ -41,13 +65,44 @@ class Config:
         """
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
 
         # Load environment variables from .env file
-        load_dotenv()
+        self._load_dotenv()
 
         # Load configuration
         self._load_config()
         self._validate_config()
+        self._flat = self._flatten(self.config)
+        self.refresh_env()
+
+    @staticmethod
+    def _load_dotenv() -> None:
+        """
+        Read the .env file into the environment on first use in this process.
+
+        Existing environment variables are never overridden, so reading the
+        file again could not change anything.
+        """
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv(override=False)
+            _DOTENV_LOADED = True
+
+    def refresh_env(self) -> None:
+        """
+        Snapshot the environment variables that Config exposes.
+
+        Called once on construction; call again if the environment changes
+        afterwards (e.g. in tests). Cached property values are discarded so
+        they pick up the new snapshot.
+        """
+        env = os.environ
+        self._env: Dict[str, Optional[str]] = {name: env.get(name) for name in ENV_VARS}
+
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
 
     def _load_config(self) -> None:
         """
@@ -63,13 +118,59 @@ class Config:
                 f"Please create config.yaml based on the project template."
             )
 
+        # Reuse a previous parse from the JSON cache (the same sidecar
+        # scripts/validate_github_actions.py writes) only if it was made from
+        # exactly this file; mtimes alone can go backwards (cp -p, tar, git)
+        stat = self.config_path.stat()
+        source = [stat.st_mtime_ns, stat.st_size]
+        cache_path = self.config_path.with_name(f".{self.config_path.name}.cache.json")
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            cached = json.loads(cache_path.read_bytes())
+            if cached['source'] == source:
+                self.config = cached['data']
+                logger.info(f"Configuration loaded from {self.config_path} (cached)")
+                return
+        except Exception:
+            # Missing, unreadable or corrupt cache: parse the YAML instead
+            pass
+
+        try:
+            # Binary mode: the loader decodes UTF-8 itself
+            with open(self.config_path, 'rb') as f:
+                self.config = yaml.load(f, Loader=_SafeLoader)
             logger.info(f"Configuration loaded from {self.config_path}")
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
 
+        self._write_config_cache(cache_path, source)
+
+    def _write_config_cache(self, cache_path: Path, source: List[int]) -> None:
+        """
+        Store the parsed configuration as JSON next to the YAML file for the next run.
+
+        Configurations JSON cannot represent faithfully (e.g. YAML dates) are
+        not cached. Written to a temporary file and renamed into place, so a
+        concurrent reader never sees a partial cache.
+
+        Args:
+            cache_path: Path of the JSON cache file
+            source: [st_mtime_ns, st_size] of the YAML file that was parsed
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            dumped = json.dumps({'source': source, 'data': self.config})
+            if json.loads(dumped)['data'] != self.config:
+                return
+            tmp_path.write_text(dumped, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except (TypeError, ValueError, OSError) as e:
+            # Unserializable values or read-only checkout: run without the cache
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _validate_config(self) -> None:
         """
         Validate required configuration fields.
@@ -109,115 +210,150 @@ class Config:
             >>> config.get('monitoring.check_interval_minutes', 60)
             60
         """
-        keys = key.split('.')
-        value = self.config
+        return self._flat.get(key, default)
+
+    @staticmethod
+    def _flatten(config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Index every configuration value by its dot-notation path.
+
+        Intermediate sections are indexed too (e.g. 'site' and 'site.url'),
+        and None values are left out so lookups fall back to the default.
+
+        Args:
+            config: Nested configuration dictionary
+
+        Returns:
+            Dictionary mapping dot-notation keys to values
+        """
+        flat: Dict[str, Any] = {}
+        stack = [('', config)]
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
+        while stack:
+            prefix, section = stack.pop()
+            for k, value in section.items():
                 if value is None:
-                    return default
-            else:
-                return default
+                    continue
+                path = f"{prefix}{k}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
 
-        return value
+        return flat
+
+    def _env_or(self, name: str, key: str, default: Any = None) -> Any:
+        """
+        Get an environment variable, falling back to a configuration value.
+
+        Args:
+            name: Environment variable name
+            key: Configuration key in dot notation
+            default: Default value if neither is set
+
+        Returns:
+            Environment value if set, otherwise configuration value or default
+        """
+        value = self._env[name]
+        if value is not None:
+            return value
+        return self.get(key, default)
 
     # Site configuration
-    @property
+    @cached_property
     def site_url(self) -> str:
         """Get the target site URL."""
         return self.get('site.url')
 
-    @property
+    @cached_property
     def keywords(self) -> List[str]:
         """Get the list of keywords to monitor."""
         return self.get('site.keywords', [])
 
-    @property
+    @cached_property
     def urgent_keywords(self) -> List[str]:
         """Get the list of urgent keywords for immediate notification."""
         return self.get('site.urgent_keywords', [])
 
-    @property
+    @cached_property
     def login_url(self) -> str:
         """Get the login page URL."""
         return self.get('site.login_url', self.site_url)
 
     # Credentials from environment variables
-    @property
+    @cached_property
     def login_email(self) -> Optional[str]:
         """Get login email from environment variable."""
-        return os.getenv('LOGIN_EMAIL')
+        return self._env['LOGIN_EMAIL']
 
-    @property
+    @cached_property
     def login_password(self) -> Optional[str]:
         """Get login password from environment variable."""
-        return os.getenv('LOGIN_PASSWORD')
+        return self._env['LOGIN_PASSWORD']
 
     # Authentication configuration
-    @property
+    @cached_property
     def auth_enabled(self) -> bool:
         """Check if authentication is enabled."""
         return self.get('auth.enabled', True)
 
-    @property
+    @cached_property
     def auth_max_retries(self) -> int:
         """Get maximum authentication retry attempts."""
         return self.get('auth.max_retries', 3)
 
-    @property
+    @cached_property
     def auth_continue_on_failure(self) -> bool:
         """Check if scraping should continue when authentication fails."""
         return self.get('auth.continue_on_failure', True)
 
     # Monitoring configuration
-    @property
+    @cached_property
     def check_interval_minutes(self) -> int:
         """Get the monitoring check interval in minutes."""
         return self.get('monitoring.check_interval_minutes', 60)
 
-    @property
+    @cached_property
     def request_timeout(self) -> int:
         """Get request timeout in seconds."""
         return self.get('monitoring.request_timeout_seconds', 30)
 
-    @property
+    @cached_property
     def max_retries(self) -> int:
         """Get maximum number of retries for failed requests."""
         return self.get('monitoring.max_retries', 3)
 
     # Email configuration
-    @property
+    @cached_property
     def smtp_server(self) -> str:
         """Get SMTP server address."""
-        return os.getenv('SMTP_SERVER', self.get('email.smtp_server'))
+        return self._env_or('SMTP_SERVER', 'email.smtp_server')
 
-    @property
+    @cached_property
     def smtp_port(self) -> int:
         """Get SMTP server port."""
-        return int(os.getenv('SMTP_PORT', self.get('email.smtp_port', 587)))
+        return int(self._env_or('SMTP_PORT', 'email.smtp_port', 587))
 
-    @property
+    @cached_property
     def use_tls(self) -> bool:
         """Check if TLS should be used for SMTP."""
         return self.get('email.use_tls', True)
 
-    @property
+    @cached_property
     def email_from(self) -> Optional[str]:
         """Get sender email address from environment."""
-        return os.getenv('EMAIL_FROM')
+        return self._env['EMAIL_FROM']
 
-    @property
+    @cached_property
     def email_password(self) -> Optional[str]:
         """Get email password from environment."""
-        return os.getenv('EMAIL_PASSWORD')
+        return self._env['EMAIL_PASSWORD']
 
-    @property
+    @cached_property
     def email_to(self) -> Optional[str]:
         """Get recipient email address from environment."""
-        return os.getenv('EMAIL_TO')
+        return self._env['EMAIL_TO']
 
-    @property
+    @cached_property
     def email_recipients(self) -> List[str]:
         """Get list of email recipients."""
         email_to = self.email_to
@@ -225,106 +361,119 @@ class Config:
             return [e.strip() for e in email_to.split(',')]
         return []
 
-    @property
+    @cached_property
     def batch_notifications(self) -> bool:
         """Check if batch notifications are enabled."""
         return self.get('email.batch_notifications', True)
 
-    @property
+    @cached_property
     def max_articles_per_email(self) -> int:
         """Get maximum articles per email."""
         return self.get('email.max_articles_per_email', 10)
 
     # Scraping configuration
-    @property
+    @cached_property
     def headless(self) -> bool:
         """Check if browser should run in headless mode."""
         return self.get('scraping.headless', True)
 
-    @property
+    @cached_property
+    def light_mode(self) -> bool:
+        """Check if the browser should skip loading images."""
+        return self.get('scraping.light_mode', True)
+
+    @cached_property
     def user_agent_rotation(self) -> bool:
         """Check if user agent rotation is enabled."""
         return self.get('scraping.user_agent_rotation', True)
 
-    @property
+    @cached_property
     def delay_min(self) -> int:
         """Get minimum delay between requests in seconds."""
         return self.get('scraping.delay_between_requests_min', 1)
 
-    @property
+    @cached_property
     def delay_max(self) -> int:
         """Get maximum delay between requests in seconds."""
         return self.get('scraping.delay_between_requests_max', 3)
 
-    @property
+    @cached_property
     def max_pages(self) -> int:
         """Get maximum pages to scrape."""
         return self.get('scraping.max_pages_to_scrape', 5)
 
     # Database configuration
-    @property
+    @cached_property
     def db_path(self) -> str:
         """Get database file path."""
         return self.get('database.path', 'data/articles.db')
 
-    @property
+    @cached_property
+    def translation_cache_path(self) -> Optional[str]:
+        """Get the persistent translation cache file path (None if caching is disabled)."""
+        if not self.get('translation.cache_enabled', True):
+            return None
+        default = str(Path(self.db_path).parent / 'translation_cache.db')
+        return self.get('translation.cache_path', default)
+
+    @cached_property
     def cleanup_enabled(self) -> bool:
         """Check if database cleanup is enabled."""
         return self.get('database.cleanup_enabled', True)
 
-    @property
+    @cached_property
     def keep_records_days(self) -> int:
         """Get number of days to keep records."""
         return self.get('database.keep_records_days', 90)
 
     # Logging configuration
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Get logging level."""
         return self.get('logging.level', 'INFO')
 
-    @property
+    @cached_property
     def log_file(self) -> str:
         """Get log file path."""
         return self.get('logging.file', 'logs/monitor.log')
 
-    @property
+    @cached_property
     def log_max_bytes(self) -> int:
         """Get maximum log file size in bytes."""
         return self.get('logging.max_bytes', 10485760)
 
-    @property
+    @cached_property
     def log_backup_count(self) -> int:
         """Get number of log backup files to keep."""
         return self.get('logging.backup_count', 5)
 
-    @property
+    @cached_property
     def console_output(self) -> bool:
         """Check if console output is enabled."""
         return self.get('logging.console_output', True)
 
-    @property
+    @cached_property
     def colored_output(self) -> bool:
         """Check if colored console output is enabled."""
         return self.get('logging.colored_output', True)
 
     # Feature flags
-    @property
+    @cached_property
     def telegram_enabled(self) -> bool:
         """Check if Telegram notifications are enabled."""
         return self.get('features.telegram_enabled', False)
 
-    @property
+    @cached_property
     def telegram_bot_token(self) -> Optional[str]:
         """Get Telegram bot token."""
-        return os.getenv('TELEGRAM_BOT_TOKEN', self.get('features.telegram_bot_token'))
+        return self._env_or('TELEGRAM_BOT_TOKEN', 'features.telegram_bot_token')
 
-    @property
+    @cached_property
     def telegram_chat_id(self) -> Optional[str]:
         """Get Telegram chat ID."""
-        return os.getenv('TELEGRAM_CHAT_ID', self.get('features.telegram_chat_id'))
+        return self._env_or('TELEGRAM_CHAT_ID', 'features.telegram_chat_id')
 
-    @property
+    @cached_property
     def collect_metrics(self) -> bool:
         """Check if performance metrics collection is enabled."""
         return self.get('features.collect_metrics', True)
@@ -8,20 +8,111 @@ This module handles all SQLite database operations including:
 - Database maintenance and cleanup
 """
 
+import os
 import sqlite3
 import logging
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Pages copied per step by backup_database before other connections get a turn
+BACKUP_PAGES_PER_STEP = 64
+
+def journal_mode() -> str:
+    """
+    Journal mode for SQLite files this application writes.
+
+    WAL keeps -wal/-shm sidecar files next to the database, which do not
+    survive the GitHub Actions artifact round-trip, so CI keeps a
+    single-file rollback journal instead.
+    """
+    return 'DELETE' if os.getenv('GITHUB_ACTIONS') == 'true' else 'WAL'
+
+
+# Per-connection tuning applied every time a connection is opened
+CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -64000",      # 64MB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",    # 256MB memory-mapped I/O
+    "PRAGMA busy_timeout = 60000",
+]
+
+# Hot-path statements. sqlite3 caches prepared statements per connection keyed
+# by SQL text, so these are reused as-is on the persistent connection.
+INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles (
+        article_id, title, title_ko, url, published_date,
+        matched_keyword, full_content, notified
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_TRANSLATION_SQL = """
+    UPDATE articles
+    SET title_ko = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE article_id = ?
+"""
+
+UPDATE_FULL_CONTENT_SQL = """
+    UPDATE articles
+    SET full_content = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE article_id = ?
+"""
+
+# updated_at is bound by the caller, so a whole batch shares one timestamp
+MARK_NOTIFIED_SQL = """
+    UPDATE articles
+    SET notified = TRUE, updated_at = ?
+    WHERE id = ?
+"""
+
+MARK_NOTIFIED_BY_ARTICLE_ID_SQL = """
+    UPDATE articles
+    SET notified = TRUE, updated_at = ?
+    WHERE article_id = ?
+"""
+
+UNNOTIFIED_COLUMNS = (
+    'id', 'article_id', 'title', 'title_ko', 'url', 'published_date',
+    'matched_keyword', 'full_content', 'created_at'
+)
+
+SELECT_UNNOTIFIED_SQL = f"""
+    SELECT {', '.join(UNNOTIFIED_COLUMNS)}
+    FROM articles
+    WHERE notified = FALSE
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+INSERT_MONITORING_LOG_SQL = """
+    INSERT INTO monitoring_logs (
+        articles_found, new_articles, status,
+        error_message, execution_time_seconds
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in the same text format as SQLite's CURRENT_TIMESTAMP."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
 
 class Database:
     """
     SQLite database manager for article tracking and monitoring logs.
 
+    A single connection is kept open for the lifetime of the object so that
+    sqlite3's prepared statement cache is reused across calls. Access is
+    serialized with a lock, so an instance may be shared between threads.
+
+    The article_ids already stored are also kept in memory, so duplicate
+    checks for known articles never reach SQLite.
+
     Attributes:
         db_path (Path): Path to the SQLite database file
     """
@@ -37,17 +128,36 @@ class Database:
             sqlite3.Error: If database initialization fails
         """
         self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._seen: Set[str] = set()
 
         # Create data directory if it doesn't exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize database schema
         self._init_database()
+        self._load_seen_ids()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the persistent database connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
 
     @contextmanager
     def _get_connection(self):
         """
-        Context manager for database connections.
+        Context manager wrapping one transaction on the persistent connection.
 
         Yields:
             sqlite3.Connection: Database connection
@@ -57,17 +167,34 @@ class Database:
             ...     cursor = conn.cursor()
             ...     cursor.execute("SELECT * FROM articles")
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            conn = self._connect()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error("Database error: %s", e)
+                raise
+
+    def close(self) -> None:
+        """
+        Close the persistent database connection.
+
+        Runs PRAGMA optimize first, which refreshes query planner statistics
+        only for tables whose queries would benefit, instead of a full ANALYZE.
+
+        Example:
+            >>> db.close()
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.debug("PRAGMA optimize failed: %s", e)
+                self._conn.close()
+                self._conn = None
 
     def _init_database(self) -> None:
         """
@@ -80,6 +207,9 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # Journal mode is persistent, so it only needs to be set once
+            cursor.execute(f"PRAGMA journal_mode = {journal_mode()}")
+
             # Create articles table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS articles (
@@ -103,11 +233,14 @@ class Database:
                 ON articles(article_id)
             """)
 
-            # Create index on notified status
+            # Create composite index on notified status and creation time.
+            # Serves both the pending-articles filter and its ORDER BY, and
+            # supersedes the older single-column idx_notified.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_notified
-                ON articles(notified)
+                CREATE INDEX IF NOT EXISTS idx_notified_created_at
+                ON articles(notified, created_at)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_notified")
 
             # Create monitoring logs table
             cursor.execute("""
@@ -122,14 +255,25 @@ class Database:
                 )
             """)
 
-            # Create index on check_time
+            # Create covering index on check_time for the stats aggregate.
+            # Leads with check_time so it also serves log cleanup, and
+            # supersedes the older single-column idx_check_time.
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_check_time
-                ON monitoring_logs(check_time)
+                CREATE INDEX IF NOT EXISTS idx_logs_stats
+                ON monitoring_logs(check_time, status, new_articles, execution_time_seconds)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_check_time")
 
             conn.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+            logger.info("Database initialized at %s", self.db_path)
+
+    def _load_seen_ids(self) -> None:
+        """
+        Rebuild the in-memory set of stored article IDs from the database.
+        """
+        with self._get_connection() as conn:
+            self._seen = {row[0] for row in conn.execute("SELECT article_id FROM articles")}
+        logger.debug("Loaded %d known article IDs", len(self._seen))
 
     def article_exists(self, article_id: str) -> bool:
         """
@@ -141,10 +285,16 @@ class Database:
         Returns:
             bool: True if article exists, False otherwise
 
+        add_article does its own duplicate detection, so this is only needed
+        by callers that want to know without inserting.
+
         Example:
-            >>> if not db.article_exists("article-123"):
-            ...     db.add_article(article_data)
+            >>> if db.article_exists("article-123"):
+            ...     print("Already stored")
         """
+        if article_id in self._seen:
+            return True
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -177,19 +327,15 @@ class Database:
             >>> db.add_article(article)
             True
         """
-        if self.article_exists(article_data['article_id']):
-            logger.debug(f"Article already exists: {article_data['article_id']}")
+        if article_data['article_id'] in self._seen:
+            logger.debug("Article already exists: %s", article_data['article_id'])
             return False
 
+        # INSERT OR IGNORE on the UNIQUE article_id doubles as the duplicate check
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO articles (
-                        article_id, title, title_ko, url, published_date,
-                        matched_keyword, full_content, notified
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                cursor.execute(INSERT_ARTICLE_SQL, (
                     article_data['article_id'],
                     article_data['title'],
                     article_data.get('title_ko'),
@@ -199,16 +345,87 @@ class Database:
                     article_data.get('full_content', ''),
                     False
                 ))
-                logger.info(f"Added new article: {article_data['title']}")
-                return True
+                added = cursor.rowcount == 1
+
+            # Only record the ID once the transaction has committed
+            self._seen.add(article_data['article_id'])
+            if not added:
+                logger.debug("Article already exists: %s", article_data['article_id'])
+                return False
+
+            logger.info("Added new article: %s", article_data['title'])
+            return True
 
-        except sqlite3.IntegrityError as e:
-            logger.warning(f"Article already exists (race condition): {article_data['article_id']}")
-            return False
         except Exception as e:
-            logger.error(f"Failed to add article: {e}")
+            logger.error("Failed to add article: %s", e)
             raise
 
+    def try_insert_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert articles that are not yet stored and return the ones inserted.
+
+        Relies on the UNIQUE constraint on article_id with INSERT OR IGNORE, so
+        no separate existence check is needed. Duplicates within the given list
+        are only inserted (and returned) once.
+
+        Args:
+            articles: List of article dictionaries (same keys as add_article)
+
+        Returns:
+            List of articles that were newly inserted, in input order
+
+        Example:
+            >>> new_articles = db.try_insert_articles(scraped_articles)
+            >>> print(f"{len(new_articles)} new articles")
+        """
+        inserted = []
+        if not articles:
+            return inserted
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for article in articles:
+                if article['article_id'] in self._seen:
+                    continue
+                cursor.execute(INSERT_ARTICLE_SQL, (
+                    article['article_id'],
+                    article['title'],
+                    article.get('title_ko'),
+                    article['url'],
+                    article.get('published_date'),
+                    article['matched_keyword'],
+                    article.get('full_content', ''),
+                    False
+                ))
+                if cursor.rowcount == 1:
+                    inserted.append(article)
+
+        self._seen.update(article['article_id'] for article in articles)
+        logger.info("Added %d new articles", len(inserted))
+        return inserted
+
+    def update_full_content_bulk(self, contents: List[Tuple[str, str]]) -> int:
+        """
+        Update full content for multiple articles in a single transaction.
+
+        Args:
+            contents: List of (article_id, full_content) pairs
+
+        Returns:
+            Number of articles updated
+
+        Example:
+            >>> db.update_full_content_bulk([('article-123', 'Article content here...')])
+            1
+        """
+        if not contents:
+            return 0
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(UPDATE_FULL_CONTENT_SQL, [(content, article_id) for article_id, content in contents])
+            return cursor.rowcount
+
     def get_unnotified_articles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve articles that haven't been notified yet.
@@ -226,22 +443,16 @@ class Database:
             ...     db.mark_as_notified(article['id'])
         """
         with self._get_connection() as conn:
+            # Plain tuples instead of sqlite3.Row; dicts are built from the
+            # known column order below
             cursor = conn.cursor()
-            query = """
-                SELECT id, article_id, title, title_ko, url, published_date,
-                       matched_keyword, full_content, created_at
-                FROM articles
-                WHERE notified = FALSE
-                ORDER BY created_at DESC
-            """
+            cursor.row_factory = None
 
-            if limit:
-                query += f" LIMIT {limit}"
+            # LIMIT -1 means no limit, so the SQL text (and its cached
+            # statement) is the same either way
+            cursor.execute(SELECT_UNNOTIFIED_SQL, (limit or -1,))
 
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-            return [dict(row) for row in rows]
+            return [dict(zip(UNNOTIFIED_COLUMNS, row)) for row in cursor.fetchall()]
 
     def mark_as_notified(self, article_id: int) -> None:
         """
@@ -255,12 +466,8 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE articles
-                SET notified = TRUE, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (article_id,))
-            logger.debug(f"Marked article {article_id} as notified")
+            cursor.execute(MARK_NOTIFIED_SQL, (_utc_timestamp(), article_id))
+            logger.debug("Marked article %s as notified", article_id)
 
     def mark_multiple_as_notified(self, article_ids: List[int]) -> None:
         """
@@ -278,13 +485,33 @@ class Database:
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ','.join('?' * len(article_ids))
-            cursor.execute(f"""
-                UPDATE articles
-                SET notified = TRUE, updated_at = CURRENT_TIMESTAMP
-                WHERE id IN ({placeholders})
-            """, article_ids)
-            logger.info(f"Marked {len(article_ids)} articles as notified")
+            # One fixed statement per row keeps a single cached prepared
+            # statement instead of compiling a new IN (...) for every size
+            now = _utc_timestamp()
+            cursor.executemany(MARK_NOTIFIED_SQL, [(now, article_id) for article_id in article_ids])
+            logger.info("Marked %d articles as notified", len(article_ids))
+
+    def mark_notified_by_article_ids(self, article_ids: List[str]) -> None:
+        """
+        Mark multiple articles as notified by their article_id field.
+
+        Args:
+            article_ids: List of article IDs (not database IDs)
+
+        Example:
+            >>> db.mark_notified_by_article_ids([a['article_id'] for a in articles])
+        """
+        if not article_ids:
+            return
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            now = _utc_timestamp()
+            cursor.executemany(
+                MARK_NOTIFIED_BY_ARTICLE_ID_SQL,
+                [(now, article_id) for article_id in article_ids]
+            )
+            logger.info("Marked %d articles as notified", len(article_ids))
 
     def update_article_translation(self, article_id: str, title_ko: str) -> bool:
         """
@@ -304,23 +531,48 @@ class Database:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    UPDATE articles
-                    SET title_ko = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE article_id = ?
-                """, (title_ko, article_id))
+                cursor.execute(UPDATE_TRANSLATION_SQL, (title_ko, article_id))
 
                 if cursor.rowcount > 0:
-                    logger.debug(f"Updated translation for {article_id}: {title_ko[:30]}...")
+                    logger.debug("Updated translation for %s: %.30s...", article_id, title_ko)
                     return True
                 else:
-                    logger.warning(f"No article found with ID: {article_id}")
+                    logger.warning("No article found with ID: %s", article_id)
                     return False
 
         except Exception as e:
-            logger.error(f"Failed to update translation for {article_id}: {e}")
+            logger.error("Failed to update translation for %s: %s", article_id, e)
             return False
 
+    def update_article_translations_bulk(self, translations: List[Tuple[str, str]]) -> int:
+        """
+        Update Korean translations for multiple articles in a single transaction.
+
+        Args:
+            translations: List of (article_id, title_ko) pairs
+
+        Returns:
+            Number of articles updated
+
+        Example:
+            >>> db.update_article_translations_bulk([('article-123', '반도화학 뉴스')])
+            1
+        """
+        if not translations:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(UPDATE_TRANSLATION_SQL, [(title_ko, article_id) for article_id, title_ko in translations])
+
+                logger.debug("Updated translations for %d articles", cursor.rowcount)
+                return cursor.rowcount
+
+        except Exception as e:
+            logger.error("Failed to update translations: %s", e)
+            return 0
+
     def log_monitoring_run(
         self,
         articles_found: int,
@@ -349,19 +601,14 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO monitoring_logs (
-                    articles_found, new_articles, status,
-                    error_message, execution_time_seconds
-                ) VALUES (?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(INSERT_MONITORING_LOG_SQL, (
                 articles_found,
                 new_articles,
                 status,
                 error_message,
                 execution_time
             ))
-            logger.debug(f"Logged monitoring run: {status}")
+            logger.debug("Logged monitoring run: %s", status)
 
     def get_monitoring_stats(self, days: int = 7) -> Dict[str, Any]:
         """
@@ -378,9 +625,9 @@ class Database:
             >>> print(f"Success rate: {stats['success_rate']:.2%}")
         """
         with self._get_connection() as conn:
+            # Aggregates always yield exactly one row; read it positionally
             cursor = conn.cursor()
-            since_date = datetime.now() - timedelta(days=days)
-
+            cursor.row_factory = None
             cursor.execute("""
                 SELECT
                     COUNT(*) as total_runs,
@@ -389,21 +636,12 @@ class Database:
                     AVG(execution_time_seconds) as avg_execution_time,
                     MAX(check_time) as last_check
                 FROM monitoring_logs
-                WHERE check_time >= ?
-            """, (since_date,))
-
-            row = cursor.fetchone()
+                WHERE check_time >= datetime('now', ?)
+            """, (f'-{days} days',))
 
-            if row and row['total_runs'] > 0:
-                return {
-                    'total_runs': row['total_runs'],
-                    'successful_runs': row['successful_runs'],
-                    'success_rate': row['successful_runs'] / row['total_runs'],
-                    'total_new_articles': row['total_new_articles'] or 0,
-                    'avg_execution_time': row['avg_execution_time'] or 0,
-                    'last_check': row['last_check']
-                }
+            total_runs, successful_runs, total_new_articles, avg_execution_time, last_check = cursor.fetchone()
 
+        if not total_runs:
             return {
                 'total_runs': 0,
                 'successful_runs': 0,
@@ -413,10 +651,22 @@ class Database:
                 'last_check': None
             }
 
+        return {
+            'total_runs': total_runs,
+            'successful_runs': successful_runs,
+            'success_rate': successful_runs / total_runs,
+            'total_new_articles': total_new_articles or 0,
+            'avg_execution_time': avg_execution_time or 0,
+            'last_check': last_check
+        }
+
     def cleanup_old_records(self, days: int = 90) -> int:
         """
         Delete records older than specified days.
 
+        Both DELETEs run in one transaction and are served by
+        idx_notified_created_at and idx_logs_stats respectively.
+
         Args:
             days: Number of days to keep (default: 90)
 
@@ -429,26 +679,37 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cutoff_date = datetime.now() - timedelta(days=days)
+            # Computed by SQLite in UTC, the same clock CURRENT_TIMESTAMP uses
+            # for created_at and check_time
+            cutoff = f'-{days} days'
 
             # Delete old articles that have been notified
             cursor.execute("""
                 DELETE FROM articles
-                WHERE created_at < ? AND notified = TRUE
-            """, (cutoff_date,))
+                WHERE created_at < datetime('now', ?) AND notified = TRUE
+            """, (cutoff,))
             articles_deleted = cursor.rowcount
 
             # Delete old monitoring logs
             cursor.execute("""
                 DELETE FROM monitoring_logs
-                WHERE check_time < ?
-            """, (cutoff_date,))
+                WHERE check_time < datetime('now', ?)
+            """, (cutoff,))
             logs_deleted = cursor.rowcount
 
-            total_deleted = articles_deleted + logs_deleted
-            logger.info(f"Cleanup: Deleted {articles_deleted} articles and {logs_deleted} logs")
+        total_deleted = articles_deleted + logs_deleted
+        logger.info("Cleanup: Deleted %d articles and %d logs", articles_deleted, logs_deleted)
+
+        if articles_deleted:
+            self._load_seen_ids()
+
+        if total_deleted:
+            # Fold the deletions back into the main file and reset the WAL so
+            # it does not stay at its high-water size (no-op outside WAL mode)
+            with self._lock:
+                self._connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
-            return total_deleted
+        return total_deleted
 
     def get_article_count(self) -> Tuple[int, int]:
         """
@@ -464,13 +725,16 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) as count FROM articles")
-            total = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM articles WHERE notified = FALSE")
-            unnotified = cursor.fetchone()['count']
+            # Both counts in one pass over idx_notified_created_at
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    SUM(CASE WHEN notified = FALSE THEN 1 ELSE 0 END) as unnotified
+                FROM articles
+            """)
+            total, unnotified = cursor.fetchone()
 
-            return total, unnotified
+            return total, unnotified or 0
 
     def backup_database(self, backup_path: Optional[str] = None) -> str:
         """
@@ -493,12 +757,17 @@ class Database:
         backup_path = Path(backup_path)
         backup_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self._get_connection() as source:
-            backup_conn = sqlite3.connect(backup_path)
-            source.backup(backup_conn)
+        # Copy from a dedicated read-only connection in small page steps, so
+        # the shared connection's lock is not held and writers can proceed
+        source = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            source.backup(backup_conn, pages=BACKUP_PAGES_PER_STEP)
+        finally:
             backup_conn.close()
+            source.close()
 
-        logger.info(f"Database backed up to {backup_path}")
+        logger.info("Database backed up to %s", backup_path)
         return str(backup_path)
 
     def __repr__(self) -> str:
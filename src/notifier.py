@@ -9,284 +9,50 @@ Features:
 - Multiple recipient support
 """
 
+import io
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from html import escape
+from operator import itemgetter
+import base64
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
+import random
 import time
 
-logger = logging.getLogger(__name__)
-
-
-class NotificationError(Exception):
-    """Custom exception for notification failures."""
-    pass
-
-
-class Notifier:
-    """
-    Handles email and other notifications for new articles.
-
-    Attributes:
-        config: Configuration object
-    """
-
-    def __init__(self, config):
-        """
-        Initialize notifier.
-
-        Args:
-            config: Configuration object with email settings
-
-        Raises:
-            ValueError: If email configuration is missing
-        """
-        self.config = config
-
-        # Validate email configuration
-        if not self.config.email_from or not self.config.email_password:
-            logger.warning("Email credentials not configured")
-
-        if not self.config.email_recipients:
-            logger.warning("No email recipients configured")
-
-    def send_article_notifications(
-        self,
-        articles: List[Dict[str, Any]],
-        max_retries: int = 3
-    ) -> bool:
-        """
-        Send email notifications for new articles.
-
-        Args:
-            articles: List of article dictionaries to notify about
-            max_retries: Maximum number of retry attempts
-
-        Returns:
-            bool: True if notification sent successfully
-
-        Example:
-            >>> notifier = Notifier(config)
-            >>> notifier.send_article_notifications(new_articles)
-        """
-        if not articles:
-            logger.info("No articles to notify about")
-            return True
-
-        if not self.config.email_recipients:
-            logger.error("No email recipients configured")
-            return False
-
-        try:
-            # Group articles by urgency
-            urgent_articles = [a for a in articles if a.get('is_urgent', False)]
-            normal_articles = [a for a in articles if not a.get('is_urgent', False)]
-
-            # Send urgent articles immediately
-            if urgent_articles:
-                logger.info(f"Sending urgent notification for {len(urgent_articles)} articles")
-                self._send_email(urgent_articles, is_urgent=True, max_retries=max_retries)
-
-            # Send normal articles (batch if enabled)
-            if normal_articles:
-                if self.config.batch_notifications:
-                    logger.info(f"Sending batch notification for {len(normal_articles)} articles")
-                    self._send_email(normal_articles, is_urgent=False, max_retries=max_retries)
-                else:
-                    logger.info(f"Sending individual notifications for {len(normal_articles)} articles")
-                    for article in normal_articles:
-                        self._send_email([article], is_urgent=False, max_retries=max_retries)
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send notifications: {e}")
-            return False
-
-    def _send_email(
-        self,
-        articles: List[Dict[str, Any]],
-        is_urgent: bool = False,
-        max_retries: int = 3
-    ) -> None:
-        """
-        Send email notification with retry logic.
-
-        Args:
-            articles: List of articles to include in email
-            is_urgent: Whether this is an urgent notification
-            max_retries: Maximum retry attempts
-
-        Raises:
-            NotificationError: If email sending fails after all retries
-        """
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.debug(f"Email send attempt {attempt}/{max_retries}")
-
-                # Create email message
-                msg = self._create_email_message(articles, is_urgent)
-
-                # Send email
-                with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                    if self.config.use_tls:
-                        server.starttls()
-
-                    server.login(self.config.email_from, self.config.email_password)
-
-                    for recipient in self.config.email_recipients:
-                        server.send_message(msg, to_addrs=[recipient])
-                        logger.info(f"Email sent to {recipient}")
-
-                return  # Success
-
-            except smtplib.SMTPAuthenticationError as e:
-                logger.error(f"Email authentication failed: {e}")
-                raise NotificationError("Invalid email credentials")
-
-            except smtplib.SMTPException as e:
-                logger.warning(f"Email send attempt {attempt} failed: {e}")
-                if attempt < max_retries:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    raise NotificationError(f"Email sending failed after {max_retries} attempts: {e}")
-
-            except Exception as e:
-                logger.error(f"Unexpected error sending email: {e}")
-                raise NotificationError(f"Email sending error: {e}")
-
-    def _create_email_message(
-        self,
-        articles: List[Dict[str, Any]],
-        is_urgent: bool = False
-    ) -> MIMEMultipart:
-        """
-        Create formatted email message.
-
-        Args:
-            articles: List of articles to include
-            is_urgent: Whether this is an urgent notification
-
-        Returns:
-            MIMEMultipart email message
-        """
-        msg = MIMEMultipart('alternative')
-
-        # Subject
-        subject_prefix = self.config.get('email.subject_prefix', '[고무뉴스]')
-        if is_urgent:
-            subject = f"{subject_prefix} 【긴급】새로운 기사 {len(articles)}건 발견"
-        else:
-            subject = f"{subject_prefix} 새로운 기사 {len(articles)}건 발견"
-
-        msg['Subject'] = subject
-        msg['From'] = self.config.email_from
-        msg['To'] = ', '.join(self.config.email_recipients)
-        msg['Date'] = datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
-
-        # Email body (plain text version)
-        text_body = self._create_text_body(articles, is_urgent)
-        part1 = MIMEText(text_body, 'plain', 'utf-8')
-
-        # Email body (HTML version)
-        html_body = self._create_html_body(articles, is_urgent)
-        part2 = MIMEText(html_body, 'html', 'utf-8')
-
-        # Attach both versions
-        msg.attach(part1)
-        msg.attach(part2)
-
-        return msg
-
-    def _create_text_body(
-        self,
-        articles: List[Dict[str, Any]],
-        is_urgent: bool = False
-    ) -> str:
-        """
-        Create plain text email body.
-
-        Args:
-            articles: List of articles
-            is_urgent: Whether this is urgent
-
-        Returns:
-            Plain text email content
-        """
-        lines = []
+# smtplib and the email package are imported where they are used, so runs
+# that find nothing to notify about don't pay for loading them
+if TYPE_CHECKING:
+    import smtplib
 
-        if is_urgent:
-            lines.append("=" * 60)
-            lines.append("【긴급】새로운 기사가 발견되었습니다!")
-            lines.append("=" * 60)
-        else:
-            lines.append("고무 업계 뉴스 모니터링 알림")
-            lines.append("=" * 60)
-
-        # 로그인 정보 추가
-        lines.append("")
-        lines.append("┌" + "─" * 40 + "┐")
-        lines.append("│    🔐 고무호지신문 로그인 정보         │")
-        lines.append("│" + "─" * 40 + "│")
-        lines.append("│      ID : gomu1239                     │")
-        lines.append("│      PW : DRB@12345678                 │")
-        lines.append("│                                        │")
-        lines.append("│   🌐 https://gomuhouchi.com            │")
-        lines.append("└" + "─" * 40 + "┘")
-        lines.append("")
-
-        lines.append(f"\n총 {len(articles)}건의 새로운 기사가 발견되었습니다.\n")
-
-        for i, article in enumerate(articles, 1):
-            lines.append(f"\n[기사 {i}]")
-            lines.append(f"제목: {article['title']}")
-
-            # Add Korean translation if available
-            if article.get('title_ko'):
-                lines.append(f"번역: {article['title_ko']}")
-
-            lines.append(f"키워드: {article['matched_keyword']}")
-            lines.append(f"링크: {article['url']}")
-
-            if article.get('published_date'):
-                lines.append(f"게시일: {article['published_date']}")
-
-            if article.get('summary'):
-                lines.append(f"요약: {article['summary'][:200]}...")
-
-            lines.append("-" * 60)
-
-        lines.append(f"\n\n모니터링 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("\n이 메일은 Gomu News Monitor에 의해 자동으로 발송되었습니다.")
-
-        return '\n'.join(lines)
-
-    def _create_html_body(
-        self,
-        articles: List[Dict[str, Any]],
-        is_urgent: bool = False
-    ) -> str:
-        """
-        Create HTML email body with styling.
-
-        Args:
-            articles: List of articles
-            is_urgent: Whether this is urgent
-
-        Returns:
-            HTML email content
-        """
-        # Color scheme
-        urgent_color = "#dc3545"
-        normal_color = "#007bff"
-        highlight_color = "#ffc107"
+logger = logging.getLogger(__name__)
 
-        header_color = urgent_color if is_urgent else normal_color
 
-        html_parts = [
-            """
+# Upper bound on the time one email may spend waiting between send retries
+SEND_RETRY_BUDGET_S = 10
+
+# Fixed MIME boundary for notification emails. Parts are base64-encoded, and
+# base64 output never contains '-', so a boundary line cannot occur in them.
+_MIME_BOUNDARY = "===============gomu-news-monitor=="
+_MIME_PART_HEADER = (
+    '--' + _MIME_BOUNDARY + '\r\n'
+    'Content-Type: text/%s; charset="utf-8"\r\n'
+    'MIME-Version: 1.0\r\n'
+    'Content-Transfer-Encoding: base64\r\n'
+    '\r\n'
+)
+_MIME_PART_HEADER_TEXT = (_MIME_PART_HEADER % 'plain').encode('ascii')
+_MIME_PART_HEADER_HTML = (_MIME_PART_HEADER % 'html').encode('ascii')
+_MIME_CLOSE = ('--' + _MIME_BOUNDARY + '--\r\n').encode('ascii')
+
+# Email colors
+URGENT_COLOR = "#dc3545"
+NORMAL_COLOR = "#007bff"
+HIGHLIGHT_COLOR = "#ffc107"
+
+# Static parts of the HTML email, built once at import. The document head is
+# a %-format template filled with the color scheme.
+_HTML_HEAD_TEMPLATE = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -301,7 +67,7 @@ class Notifier:
                         padding: 20px;
                     }
                     .header {
-                        background: linear-gradient(135deg, """ + header_color + """ 0%, """ + header_color + """dd 100%);
+                        background: linear-gradient(135deg, %(header_color)s 0%%, %(header_color)sdd 100%%);
                         color: white;
                         padding: 30px;
                         border-radius: 10px 10px 0 0;
@@ -314,7 +80,7 @@ class Notifier:
                     .summary {
                         background: #f8f9fa;
                         padding: 20px;
-                        border-left: 4px solid """ + header_color + """;
+                        border-left: 4px solid %(header_color)s;
                         margin: 20px 0;
                     }
                     .article {
@@ -332,14 +98,14 @@ class Notifier:
                         margin-bottom: 10px;
                     }
                     .article-title a {
-                        color: """ + header_color + """;
+                        color: %(header_color)s;
                         text-decoration: none;
                     }
                     .article-title a:hover {
                         text-decoration: underline;
                     }
                     .keyword-badge {
-                        background: """ + highlight_color + """;
+                        background: %(highlight_color)s;
                         color: #000;
                         padding: 4px 12px;
                         border-radius: 12px;
@@ -367,7 +133,7 @@ class Notifier:
                         border-top: 1px solid #dee2e6;
                     }
                     .urgent-badge {
-                        background: """ + urgent_color + """;
+                        background: %(urgent_color)s;
                         color: white;
                         padding: 6px 12px;
                         border-radius: 4px;
@@ -432,15 +198,9 @@ class Notifier:
                 <div class="header">
                     <h1>🔔 고무 업계 뉴스 알림</h1>
             """
-        ]
 
-        if is_urgent:
-            html_parts.append('<div class="urgent-badge">⚠️ 긴급 알림</div>')
-
-        html_parts.append('</div>')
-
-        # Credentials box (로그인 정보) - 인라인 스타일 사용 (이메일 클라이언트 호환성)
-        html_parts.append("""
+# Credentials box (로그인 정보) - 인라인 스타일 사용 (이메일 클라이언트 호환성)
+_HTML_CREDENTIALS_BLOCK = """
             <div class="credentials-box" style="background-color: #1a237e; border: 3px solid #ffd700; border-radius: 12px; padding: 20px 25px; margin: 20px 0; text-align: center;">
                 <div class="credentials-title" style="color: #ffd700; font-size: 16px; font-weight: bold; margin-bottom: 15px;">🔐 고무호지신문 로그인 정보</div>
                 <div class="credentials-content" style="background-color: #ffffff; border-radius: 8px; padding: 15px 20px; display: inline-block;">
@@ -457,78 +217,695 @@ class Notifier:
                     🌐 <a href="https://gomuhouchi.com" target="_blank" style="color: #90caf9; text-decoration: underline;">고무호지신문 바로가기</a>
                 </div>
             </div>
-        """)
+        """
 
-        # Summary section
-        html_parts.append(f"""
-            <div class="summary">
-                <strong>총 {len(articles)}건의 새로운 기사가 발견되었습니다.</strong><br>
-                모니터링 시간: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}
+_HTML_FOOTER = """
+            <div class="footer">
+                <p>이 메일은 <strong>Gomu News Monitor</strong>에 의해 자동으로 발송되었습니다.</p>
+                <p>© 2024 Gomu News Monitor. All rights reserved.</p>
             </div>
-        """)
+            </body>
+            </html>
+        """
 
-        # Articles
-        for i, article in enumerate(articles, 1):
-            html_parts.append(f"""
+
+def _is_permanent_smtp_error(error: Exception) -> bool:
+    """
+    Check whether an SMTP error is a permanent (5xx) failure.
+
+    Retrying those cannot succeed; 4xx replies and dropped connections are
+    treated as transient.
+
+    Args:
+        error: Exception raised by smtplib
+
+    Returns:
+        True if the server permanently rejected the message
+    """
+    import smtplib
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        codes = [code for code, _ in error.recipients.values()]
+        return bool(codes) and all(code >= 500 for code in codes)
+
+    code = getattr(error, 'smtp_code', None)
+    return isinstance(code, int) and code >= 500
+
+
+def _date_header() -> str:
+    """Current time formatted for the Date header."""
+    return datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
+
+
+def _build_raw_mime(
+    subject: str,
+    from_addr: str,
+    to_header: str,
+    text_body: str,
+    html_body: str
+) -> bytes:
+    """
+    Assemble a multipart/alternative message directly as RFC 5322 bytes.
+
+    Produces the same structure as MIMEMultipart('alternative') with two
+    utf-8 MIMEText parts, without going through email.generator. Both parts
+    are base64-encoded like MIMEText does for utf-8, so no line exceeds
+    the SMTP length limit and the fixed boundary cannot occur in them.
+
+    Args:
+        subject: Subject line (may contain non-ASCII text)
+        from_addr: Sender address
+        to_header: Value of the To header
+        text_body: Plain text version
+        html_body: HTML version
+
+    Returns:
+        Message bytes with CRLF line endings, ready for SMTP.sendmail
+    """
+    from email.header import Header
+
+    encoded_subject = Header(subject, 'utf-8').encode(linesep='\r\n')
+    headers = (
+        f'Content-Type: multipart/alternative; boundary="{_MIME_BOUNDARY}"\r\n'
+        'MIME-Version: 1.0\r\n'
+        f"Subject: {encoded_subject}\r\n"
+        f"From: {from_addr}\r\n"
+        f"To: {to_header}\r\n"
+        f"Date: {_date_header()}\r\n"
+        '\r\n'
+    )
+
+    return b''.join((
+        headers.encode('utf-8'),
+        _MIME_PART_HEADER_TEXT,
+        base64.encodebytes(text_body.encode('utf-8')).replace(b'\n', b'\r\n'),
+        _MIME_PART_HEADER_HTML,
+        base64.encodebytes(html_body.encode('utf-8')).replace(b'\n', b'\r\n'),
+        _MIME_CLOSE,
+    ))
+
+
+def _sendmail_pipelined(
+    server: 'smtplib.SMTP',
+    from_addr: str,
+    to_addrs: List[str],
+    msg: bytes
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    Send one message using ESMTP PIPELINING (RFC 2920).
+
+    MAIL FROM, every RCPT TO and DATA are written in a single packet and
+    their replies read afterwards, so the envelope costs one round trip
+    instead of one per command. Behaves like SMTP.sendmail otherwise: the
+    same exceptions for a refused sender, all recipients refused or a
+    rejected message, and the same dict of refused recipients on success.
+
+    Args:
+        server: Logged-in SMTP connection whose server advertises PIPELINING
+        from_addr: Envelope sender
+        to_addrs: Envelope recipients
+        msg: Message bytes with CRLF line endings
+
+    Returns:
+        Dict mapping each refused recipient to its (code, message) reply
+    """
+    import re
+    import smtplib
+
+    commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}\r\n"]
+    commands.extend(f"RCPT TO:{smtplib.quoteaddr(addr)}\r\n" for addr in to_addrs)
+    commands.append("DATA\r\n")
+    server.send(''.join(commands))
+
+    # Replies arrive in command order
+    mail_reply = server.getreply()
+    rcpt_replies = [server.getreply() for _ in to_addrs]
+    data_code, data_resp = server.getreply()
+
+    refused = {
+        addr: reply for addr, reply in zip(to_addrs, rcpt_replies)
+        if reply[0] not in (250, 251)
+    }
+
+    def abort():
+        # DATA may have been accepted even though the envelope was not
+        if data_code == 354:
+            server.send(b'.\r\n')
+            server.getreply()
+        server.rset()
+
+    if mail_reply[0] != 250:
+        abort()
+        raise smtplib.SMTPSenderRefused(mail_reply[0], mail_reply[1], from_addr)
+    if len(refused) == len(to_addrs):
+        abort()
+        raise smtplib.SMTPRecipientsRefused(refused)
+    if data_code != 354:
+        server.rset()
+        raise smtplib.SMTPDataError(data_code, data_resp)
+
+    # Dot-stuff lines starting with '.', then terminate the data
+    body = re.sub(rb'(?m)^\.', b'..', msg)
+    if not body.endswith(b'\r\n'):
+        body += b'\r\n'
+    server.send(body + b'.\r\n')
+
+    code, resp = server.getreply()
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPDataError(code, resp)
+
+    return refused
+
+
+def _build_html_prefix(is_urgent: bool) -> str:
+    """
+    Render everything before the summary section for one urgency level.
+
+    Args:
+        is_urgent: Whether this is an urgent notification
+
+    Returns:
+        Document head, header (with urgent badge if needed) and credentials box
+    """
+    header_color = URGENT_COLOR if is_urgent else NORMAL_COLOR
+    head = _HTML_HEAD_TEMPLATE % {
+        'header_color': header_color,
+        'highlight_color': HIGHLIGHT_COLOR,
+        'urgent_color': URGENT_COLOR,
+    }
+    badge = '<div class="urgent-badge">⚠️ 긴급 알림</div>' if is_urgent else ''
+    return head + badge + '</div>' + _HTML_CREDENTIALS_BLOCK
+
+
+# Only the header color varies, so both variants are rendered up front
+_HTML_PREFIX_URGENT = _build_html_prefix(True)
+_HTML_PREFIX_NORMAL = _build_html_prefix(False)
+
+# Per-article HTML, filled with one %-substitution per article. Optional
+# blocks are rendered from the fragments below or left empty.
+_ARTICLE_HTML_TEMPLATE = """
                 <div class="article">
                     <div class="article-title">
-                        {i}. <a href="{article['url']}" target="_blank">{article['title']}</a>
+                        %(index)d. <a href="%(url)s" target="_blank">%(title)s</a>
                     </div>
-            """)
+            %(translation_block)s
+                    <div>
+                        <span class="keyword-badge">🔑 %(keyword)s</span>
+            %(urgent_block)s</div>%(date_block)s%(summary_block)s
+                <div class="article-meta">
+                    🔗 <a href="%(url)s" target="_blank">기사 전문 보기</a>
+                </div>
+            </div>
+            """
 
-            # Add Korean translation if available
-            if article.get('title_ko'):
-                html_parts.append(f"""
+_TRANSLATION_FRAG = """
                     <div style="margin: 8px 0 15px 0; padding-left: 15px; border-left: 3px solid #4CAF50; color: #2c5f2d; font-size: 15px; line-height: 1.6; font-weight: 500;">
-                        → {article['title_ko']}
+                        → %s
                     </div>
-                """)
-
-            html_parts.append("""
-                    <div>
-                        <span class="keyword-badge">🔑 """ + article['matched_keyword'] + """</span>
-            """)
-
-            if article.get('is_urgent'):
-                html_parts.append('<span class="urgent-badge">긴급</span>')
+                """
 
-            html_parts.append('</div>')
+_URGENT_FRAG = '<span class="urgent-badge">긴급</span>'
 
-            if article.get('published_date'):
-                html_parts.append(f"""
+_DATE_FRAG = """
                     <div class="article-meta">
-                        📅 게시일: {article['published_date']}
+                        📅 게시일: %s
                     </div>
-                """)
+                """
 
-            if article.get('summary'):
-                summary = article['summary'][:300]
-                if len(article['summary']) > 300:
-                    summary += '...'
-                html_parts.append(f"""
+_SUMMARY_FRAG = """
                     <div class="article-summary">
-                        {summary}
+                        %s
                     </div>
-                """)
+                """
 
-            html_parts.append(f"""
-                <div class="article-meta">
-                    🔗 <a href="{article['url']}" target="_blank">기사 전문 보기</a>
-                </div>
-            </div>
-            """)
 
-        # Footer
-        html_parts.append("""
-            <div class="footer">
-                <p>이 메일은 <strong>Gomu News Monitor</strong>에 의해 자동으로 발송되었습니다.</p>
-                <p>© 2024 Gomu News Monitor. All rights reserved.</p>
+# Required article fields, fetched in one call
+_ARTICLE_FIELDS = itemgetter('title', 'url', 'matched_keyword')
+
+
+def _render_article_html(index: int, article: Dict[str, Any]) -> str:
+    """
+    Render one article block of the HTML email.
+
+    Scraped text is HTML-escaped, so titles or summaries containing '&' or
+    '<' cannot break the markup.
+
+    Args:
+        index: 1-based position of the article in the email
+        article: Article dictionary
+
+    Returns:
+        HTML fragment for the article
+    """
+    title, url, keyword = _ARTICLE_FIELDS(article)
+    title_ko = article.get('title_ko')
+    published_date = article.get('published_date')
+    summary = article.get('summary')
+    if summary and len(summary) > 300:
+        summary = summary[:300] + '...'
+
+    return _ARTICLE_HTML_TEMPLATE % {
+        'index': index,
+        'url': escape(url),
+        'title': escape(title),
+        'keyword': escape(keyword),
+        'translation_block': _TRANSLATION_FRAG % escape(title_ko) if title_ko else '',
+        'urgent_block': _URGENT_FRAG if article.get('is_urgent') else '',
+        'date_block': _DATE_FRAG % escape(str(published_date)) if published_date else '',
+        'summary_block': _SUMMARY_FRAG % escape(summary) if summary else '',
+    }
+
+
+# Plain text email: 로그인 정보 box shown below the title
+_TEXT_CREDENTIALS_LINES = [
+    "",
+    "┌" + "─" * 40 + "┐",
+    "│    🔐 고무호지신문 로그인 정보         │",
+    "│" + "─" * 40 + "│",
+    "│      ID : gomu1239                     │",
+    "│      PW : DRB@12345678                 │",
+    "│                                        │",
+    "│   🌐 https://gomuhouchi.com            │",
+    "└" + "─" * 40 + "┘",
+    "",
+]
+
+_TEXT_PREFIX_URGENT = '\n'.join(
+    ["=" * 60, "【긴급】새로운 기사가 발견되었습니다!", "=" * 60] + _TEXT_CREDENTIALS_LINES
+) + '\n'
+_TEXT_PREFIX_NORMAL = '\n'.join(
+    ["고무 업계 뉴스 모니터링 알림", "=" * 60] + _TEXT_CREDENTIALS_LINES
+) + '\n'
+_TEXT_SEPARATOR = "-" * 60 + "\n"
+
+
+class NotificationError(Exception):
+    """Custom exception for notification failures."""
+    pass
+
+
+class Notifier:
+    """
+    Handles email and other notifications for new articles.
+
+    Attributes:
+        config: Configuration object
+    """
+
+    def __init__(self, config):
+        """
+        Initialize notifier.
+
+        Args:
+            config: Configuration object with email settings
+
+        Raises:
+            ValueError: If email configuration is missing
+        """
+        self.config = config
+
+        # Header values that stay the same for every email
+        self._from_header = self.config.email_from
+        self._to_header = ', '.join(self.config.email_recipients or [])
+        self._subject_prefix = self.config.get('email.subject_prefix', '[고무뉴스]')
+
+        # SMTP connection shared by the sends inside session()
+        self._smtp: Optional['smtplib.SMTP'] = None
+        self._keep_smtp_open = False
+
+        # Validate email configuration
+        if not self.config.email_from or not self.config.email_password:
+            logger.warning("Email credentials not configured")
+
+        if not self.config.email_recipients:
+            logger.warning("No email recipients configured")
+
+    def send_article_notifications(
+        self,
+        articles: List[Dict[str, Any]],
+        max_retries: int = 3
+    ) -> bool:
+        """
+        Send email notifications for new articles.
+
+        Args:
+            articles: List of article dictionaries to notify about
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            bool: True if notification sent successfully
+
+        Example:
+            >>> notifier = Notifier(config)
+            >>> notifier.send_article_notifications(new_articles)
+        """
+        if not articles:
+            logger.info("No articles to notify about")
+            return True
+
+        if not self.config.email_recipients:
+            logger.error("No email recipients configured")
+            return False
+
+        try:
+            # One SMTP connection (and TLS/AUTH handshake) for every email below
+            with self.session():
+                for group in self.group_articles(articles):
+                    is_urgent = group[0].get('is_urgent', False)
+                    logger.info(f"Sending {'urgent' if is_urgent else 'normal'} notification for {len(group)} articles")
+                    self._send_email(group, is_urgent=is_urgent, max_retries=max_retries)
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to send notifications: {e}")
+            return False
+
+    def group_articles(self, articles: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Split articles into the groups that are sent as one email each.
+
+        Urgent articles always share one email, sent first. Normal articles
+        share one email if batch notifications are enabled, and get one
+        email each otherwise.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            List of article groups, one per email
+        """
+        urgent_articles = []
+        normal_articles = []
+        for article in articles:
+            (urgent_articles if article.get('is_urgent', False) else normal_articles).append(article)
+
+        groups = [urgent_articles] if urgent_articles else []
+        if normal_articles:
+            if self.config.batch_notifications:
+                groups.append(normal_articles)
+            else:
+                groups.extend([article] for article in normal_articles)
+
+        return groups
+
+    def _send_email(
+        self,
+        articles: List[Dict[str, Any]],
+        is_urgent: bool = False,
+        max_retries: int = 3
+    ) -> None:
+        """
+        Send email notification with retry logic.
+
+        Args:
+            articles: List of articles to include in email
+            is_urgent: Whether this is an urgent notification
+            max_retries: Maximum retry attempts
+
+        Raises:
+            NotificationError: If email sending fails after all retries
+        """
+        import smtplib
+
+        deadline = time.monotonic() + SEND_RETRY_BUDGET_S
+        msg = None
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                logger.debug(f"Email send attempt {attempt}/{max_retries}")
+
+                # Create email message (once; retries resend the same one)
+                if msg is None:
+                    msg = self._create_email_message(articles, is_urgent)
+
+                # Send email
+                server = self._smtp_connection()
+                if server is self._smtp:
+                    self._deliver(server, msg)
+                else:
+                    with server:
+                        self._deliver(server, msg)
+
+                return  # Success
+
+            except smtplib.SMTPAuthenticationError as e:
+                logger.error(f"Email authentication failed: {e}")
+                raise NotificationError("Invalid email credentials")
+
+            except smtplib.SMTPException as e:
+                logger.warning(f"Email send attempt {attempt} failed: {e}")
+                if _is_permanent_smtp_error(e):
+                    raise NotificationError(f"Email rejected by server: {e}")
+
+                # Capped exponential backoff with full jitter, within the budget
+                delay = random.uniform(0, min(2 ** attempt, 10))
+                if attempt < max_retries and time.monotonic() + delay < deadline:
+                    time.sleep(delay)
+                else:
+                    raise NotificationError(f"Email sending failed after {attempt} attempts: {e}")
+
+            except Exception as e:
+                logger.error(f"Unexpected error sending email: {e}")
+                raise NotificationError(f"Email sending error: {e}")
+
+    def _deliver(self, server: 'smtplib.SMTP', msg: bytes) -> None:
+        """
+        Send a message to every configured recipient over an open connection.
+
+        All recipients go into one SMTP transaction (one RCPT TO each), so
+        the message data is only transmitted once.
+
+        Args:
+            server: Logged-in SMTP connection
+            msg: Message to send
+        """
+        recipients = list(self.config.email_recipients)
+        if server.has_extn('pipelining'):
+            refused = _sendmail_pipelined(server, self.config.email_from, recipients, msg)
+        else:
+            refused = server.sendmail(self.config.email_from, recipients, msg)
+
+        for recipient in recipients:
+            if recipient in refused:
+                logger.warning(f"Email refused for {recipient}: {refused[recipient]}")
+            else:
+                logger.info(f"Email sent to {recipient}")
+
+    def _open_smtp(self) -> 'smtplib.SMTP':
+        """
+        Open a new SMTP connection, upgraded to TLS if configured and logged in.
+
+        Returns:
+            Logged-in SMTP connection
+        """
+        import smtplib
+
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        try:
+            if self.config.use_tls:
+                server.starttls()
+
+            server.login(self.config.email_from, self.config.email_password)
+        except BaseException:
+            server.close()
+            raise
+
+        return server
+
+    def _smtp_connection(self) -> 'smtplib.SMTP':
+        """
+        Get an SMTP connection for the next send.
+
+        Inside session() the shared connection is returned while a NOOP
+        still gets a 250 reply, and replaced otherwise. Outside it, a new
+        connection is opened that the caller must close.
+
+        Returns:
+            Logged-in SMTP connection
+        """
+        import smtplib
+
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.debug("SMTP connection lost, reconnecting")
+            self._close_smtp()
+
+        server = self._open_smtp()
+        if self._keep_smtp_open:
+            self._smtp = server
+        return server
+
+    def _close_smtp(self) -> None:
+        """Close the shared SMTP connection, if one is open."""
+        import smtplib
+
+        if self._smtp is None:
+            return
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+    @contextmanager
+    def session(self):
+        """
+        Share one SMTP connection between all sends inside the block.
+
+        The connection is opened on the first send and closed on exit.
+        Nested sessions reuse the outer one, so callers can wrap several
+        send_article_notifications() calls in a single connection.
+
+        Example:
+            >>> with notifier.session():
+            ...     for group in groups:
+            ...         notifier.send_article_notifications(group)
+        """
+        if self._keep_smtp_open:
+            yield  # Already inside an outer session, which closes the connection
+            return
+
+        self._keep_smtp_open = True
+        try:
+            yield
+        finally:
+            self._keep_smtp_open = False
+            self._close_smtp()
+
+    def _create_email_message(
+        self,
+        articles: List[Dict[str, Any]],
+        is_urgent: bool = False
+    ) -> bytes:
+        """
+        Create formatted email message.
+
+        Args:
+            articles: List of articles to include
+            is_urgent: Whether this is an urgent notification
+
+        Returns:
+            Serialized multipart/alternative email message
+        """
+        # Subject
+        if is_urgent:
+            subject = f"{self._subject_prefix} 【긴급】새로운 기사 {len(articles)}건 발견"
+        else:
+            subject = f"{self._subject_prefix} 새로운 기사 {len(articles)}건 발견"
+
+        text_body, html_body = self._render_bodies(articles, is_urgent)
+
+        return _build_raw_mime(
+            subject,
+            self._from_header,
+            self._to_header,
+            text_body,
+            html_body
+        )
+
+    def _render_bodies(
+        self,
+        articles: List[Dict[str, Any]],
+        is_urgent: bool = False
+    ) -> Tuple[str, str]:
+        """
+        Render the plain text and HTML versions of the email body.
+
+        Args:
+            articles: List of articles to include
+            is_urgent: Whether this is an urgent notification
+
+        Returns:
+            (text_body, html_body)
+        """
+        return self._create_text_body(articles, is_urgent), self._create_html_body(articles, is_urgent)
+
+    def _create_text_body(
+        self,
+        articles: List[Dict[str, Any]],
+        is_urgent: bool = False
+    ) -> str:
+        """
+        Create plain text email body.
+
+        Args:
+            articles: List of articles
+            is_urgent: Whether this is urgent
+
+        Returns:
+            Plain text email content
+        """
+        buf = io.StringIO()
+        buf.write(_TEXT_PREFIX_URGENT if is_urgent else _TEXT_PREFIX_NORMAL)
+        buf.write(f"\n총 {len(articles)}건의 새로운 기사가 발견되었습니다.\n\n")
+
+        for i, article in enumerate(articles, 1):
+            title, url, keyword = _ARTICLE_FIELDS(article)
+            title_ko = article.get('title_ko')
+            published_date = article.get('published_date')
+            summary = article.get('summary')
+            if summary and len(summary) > 200:
+                summary = summary[:200]
+
+            # One join per article; optional lines are None and dropped
+            buf.write('\n'.join(filter(None, (
+                f"\n[기사 {i}]",
+                f"제목: {title}",
+                # Add Korean translation if available
+                f"번역: {title_ko}" if title_ko else None,
+                f"키워드: {keyword}",
+                f"링크: {url}",
+                f"게시일: {published_date}" if published_date else None,
+                f"요약: {summary}..." if summary else None,
+                _TEXT_SEPARATOR,
+            ))))
+
+        buf.write(f"\n\n모니터링 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf.write("\n이 메일은 Gomu News Monitor에 의해 자동으로 발송되었습니다.")
+
+        return buf.getvalue()
+
+    def _create_html_body(
+        self,
+        articles: List[Dict[str, Any]],
+        is_urgent: bool = False
+    ) -> str:
+        """
+        Create HTML email body with styling.
+
+        Args:
+            articles: List of articles
+            is_urgent: Whether this is urgent
+
+        Returns:
+            HTML email content
+        """
+        buf = io.StringIO()
+        buf.write(_HTML_PREFIX_URGENT if is_urgent else _HTML_PREFIX_NORMAL)
+
+        # Summary section
+        buf.write(f"""
+            <div class="summary">
+                <strong>총 {len(articles)}건의 새로운 기사가 발견되었습니다.</strong><br>
+                모니터링 시간: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M:%S')}
             </div>
-            </body>
-            </html>
         """)
 
-        return ''.join(html_parts)
+        # Articles
+        for i, article in enumerate(articles, 1):
+            buf.write(_render_article_html(i, article))
+
+        # Footer
+        buf.write(_HTML_FOOTER)
+
+        return buf.getvalue()
 
     def send_error_notification(self, error_message: str) -> None:
         """
@@ -540,14 +917,17 @@ class Notifier:
         Example:
             >>> notifier.send_error_notification("Database connection failed")
         """
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
         if not self.config.get('email.send_error_notifications', True):
             return
 
         try:
             msg = MIMEMultipart()
-            msg['Subject'] = f"{self.config.get('email.subject_prefix', '[고무뉴스]')} 【오류】모니터링 에러 발생"
-            msg['From'] = self.config.email_from
-            msg['To'] = ', '.join(self.config.email_recipients)
+            msg['Subject'] = f"{self._subject_prefix} 【오류】모니터링 에러 발생"
+            msg['From'] = self._from_header
+            msg['To'] = self._to_header
 
             body = f"""
             고무 뉴스 모니터링 시스템에서 오류가 발생했습니다.
@@ -564,10 +944,7 @@ class Notifier:
 
             msg.attach(MIMEText(body, 'plain', 'utf-8'))
 
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                if self.config.use_tls:
-                    server.starttls()
-                server.login(self.config.email_from, self.config.email_password)
+            with self._open_smtp() as server:
                 server.send_message(msg)
 
             logger.info("Error notification sent")
@@ -14,11 +14,17 @@ import time
 import re
 import hashlib
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Pattern, FrozenSet
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -27,16 +33,166 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     WebDriverException,
-    StaleElementReferenceException
 )
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from bs4 import BeautifulSoup, Tag
+import soupsieve
+
+# lxml's C parser is a requirement; html.parser keeps older installs working
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 logger = logging.getLogger(__name__)
 
+# Common article body selectors, tried in order
+CONTENT_SELECTORS = [
+    '.article-content',
+    '.entry-content',
+    '.post-content',
+    'article .content',
+    '[class*="content"]',
+]
+CONTENT_SELECTOR_UNION = ', '.join(CONTENT_SELECTORS)
+
+# Desktop Chrome User-Agents for scraping.user_agent_rotation (the browser is
+# Chrome, so only Chrome UAs; bundled to avoid a network fetch at startup)
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+)
+
+# Chrome content settings for scraping.light_mode (2 = block)
+LIGHT_MODE_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+}
+
+# Common article container selectors on listing pages, tried in order
+ARTICLE_SELECTORS = [
+    'article',
+    '.article',
+    '.post',
+    '.news-item',
+    '.entry',
+    '[class*="article"]',
+]
+ARTICLE_SELECTOR_UNION = ', '.join(ARTICLE_SELECTORS)
+
+# Member-only indicators in article title/summary text
+MEMBER_TEXT_INDICATORS = (
+    '会員限定',  # Member limited (Japanese)
+    '会員専用',  # Member exclusive (Japanese)
+    'プレミアム',  # Premium (Japanese)
+    '有料会員',  # Paid member (Japanese)
+    '登録会員',  # Registered member (Japanese)
+    'member-only',
+    'premium',
+    'subscription',
+)
+
+# Member-only indicators in article element markup (CSS classes)
+MEMBER_CLASS_INDICATORS = (
+    'member-only',
+    'premium',
+    'subscriber-only',
+    'paywall',
+    'locked',
+)
+
+# Matched against the parsed element tree, so the fragment is never serialized
+MEMBER_CLASS_SELECTOR = soupsieve.compile(
+    ', '.join(f'[class*="{indicator}" i]' for indicator in MEMBER_CLASS_INDICATORS)
+)
+
+# Login required messages on an article page
+LOGIN_INDICATORS = (
+    'ログインが必要です',  # Login required (Japanese)
+    'ログインしてください',  # Please login (Japanese)
+    '会員登録が必要',  # Membership required (Japanese)
+    'この記事を読むには',  # To read this article (Japanese)
+    'login required',
+    'sign in to read',
+    'subscription required',
+)
+
+
+def _indicator_regex(indicators: Tuple[str, ...]) -> Pattern:
+    """Compile indicators into one case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, indicators)), re.IGNORECASE)
+
+
+# Each scanned once over the original text, without a lowercased copy
+MEMBER_TEXT_RE = _indicator_regex(MEMBER_TEXT_INDICATORS)
+LOGIN_REQUIRED_RE = _indicator_regex(LOGIN_INDICATORS)
+
+# Article field selectors, compiled once and tried in priority order (a union
+# selector would return the first match in document order instead)
+TITLE_SELECTORS = tuple(map(soupsieve.compile, ('h2', 'h3', '.title', '.headline', 'a')))
+DATE_SELECTORS = tuple(map(soupsieve.compile, ('.date', '.published', 'time', '[datetime]')))
+SUMMARY_SELECTORS = tuple(map(soupsieve.compile, ('.excerpt', '.summary', 'p')))
+
+
+def _select_first(soup: Tag, selectors: Tuple[Any, ...]) -> Optional[Tag]:
+    """Return the first match of the highest-priority selector that matches."""
+    for selector in selectors:
+        element = selector.select_one(soup)
+        if element is not None:
+            return element
+    return None
+
+
+# "Next page" links as one CSS union, plus link text (which CSS can't match)
+NEXT_PAGE_SELECTOR = 'a.next, a[rel="next"], .pagination .next, a[aria-label="Next"]'
+NEXT_PAGE_TEXT_XPATH = "//a[contains(., '次へ') or contains(., 'Next')]"  # Japanese "next"
+
+# Same check for pages parsed with BeautifulSoup; link text only counts inside
+# a pagination block, so article titles containing "Next" don't match
+PAGINATION_CONTAINERS = '.pagination, .nav-links, .wp-pagenavi, nav.navigation'
+NEXT_PAGE_STATIC_SELECTOR = soupsieve.compile(
+    f'{NEXT_PAGE_SELECTOR}, :is({PAGINATION_CONTAINERS}) a:-soup-contains("次へ", "Next")'
+)
+
+
+@lru_cache(maxsize=8)
+def _keyword_matcher(
+    keywords: Tuple[str, ...],
+    urgent_keywords: Tuple[str, ...]
+) -> Tuple[Pattern, Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+    """
+    Build the matcher for a keyword configuration once per distinct config.
+
+    Returns a single case-insensitive alternation regex over all keywords
+    (longest first), which rejects non-matching text in one C-level pass;
+    the (keyword, lowercased) pairs in priority order for resolving a hit;
+    and the urgent keywords as a set.
+    """
+    ordered = tuple(dict.fromkeys(keywords + urgent_keywords))  # Drop repeats, keep order
+    pairs = tuple((keyword, keyword.lower()) for keyword in ordered)
+    if pairs:
+        alternation = '|'.join(re.escape(keyword) for keyword in sorted(ordered, key=len, reverse=True))
+        pattern = re.compile(alternation, re.IGNORECASE)
+    else:
+        pattern = re.compile(r'(?!)')  # never matches
+    return pattern, pairs, frozenset(urgent_keywords)
+
+
+# Supported date formats, matched against the first 19 characters:
+#   %Y-%m-%d, %Y-%m-%dT%H:%M:%S, %Y-%m-%d %H:%M:%S, %Y/%m/%d, %Y年%m月%d日
+DATE_PATTERNS = (
+    re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})(?:(?:[Tt]|\s+)(\d{1,2}):(\d{1,2}):(\d{1,2}))?'),
+    re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'),
+    re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日'),  # Japanese format
+)
+
 
 class ScrapingError(Exception):
     """Custom exception for scraping failures."""
@@ -50,7 +206,7 @@ class NewsScraper:
     Attributes:
         config: Configuration object
         driver: Selenium WebDriver instance
-        user_agent: UserAgent instance for rotation
+        user_agents: User-Agent strings to rotate through (empty to keep Chrome's own)
     """
 
     def __init__(self, config, authenticator=None):
@@ -68,7 +224,10 @@ class NewsScraper:
         self.config = config
         self.authenticator = authenticator
         self.driver = None
-        self.user_agent = UserAgent() if config.user_agent_rotation else None
+        self.user_agents = USER_AGENTS if config.user_agent_rotation else ()
+        self.session: Optional[requests.Session] = None
+        self._driver_lock = threading.Lock()  # WebDriver is not thread-safe
+        self.implicit_wait = config.get('scraping.implicit_wait_s', 10)
 
     def _setup_driver(self) -> webdriver.Chrome:
         """
@@ -88,6 +247,10 @@ class NewsScraper:
                 chrome_options.add_argument('--headless')
                 chrome_options.add_argument('--disable-gpu')
 
+            # Return from driver.get() at DOMContentLoaded; article lists are
+            # waited for explicitly, so the full subresource load isn't needed
+            chrome_options.page_load_strategy = self.config.get('scraping.page_load_strategy', 'eager')
+
             # Common options for stability
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
@@ -95,13 +258,15 @@ class NewsScraper:
             chrome_options.add_argument('--window-size=1920,1080')
 
             # User agent
-            if self.user_agent:
-                user_agent_string = self.user_agent.random
+            if self.user_agents:
+                user_agent_string = random.choice(self.user_agents)
                 chrome_options.add_argument(f'user-agent={user_agent_string}')
                 logger.debug(f"Using User-Agent: {user_agent_string[:50]}...")
 
-            # Disable images for faster loading (optional)
-            # chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            # Skip image downloads; only text and markup are scraped
+            if self.config.light_mode:
+                chrome_options.add_experimental_option('prefs', LIGHT_MODE_PREFS)
+                chrome_options.add_argument('--blink-settings=imagesEnabled=false')
 
             # Setup service - use system chromedriver in GitHub Actions
             if os.getenv('GITHUB_ACTIONS') == 'true':
@@ -116,7 +281,7 @@ class NewsScraper:
                 driver = webdriver.Chrome(service=service, options=chrome_options)
 
             driver.set_page_load_timeout(self.config.request_timeout)
-            driver.implicitly_wait(10)
+            driver.implicitly_wait(self.implicit_wait)
 
             logger.info("WebDriver initialized successfully")
             return driver
@@ -149,11 +314,45 @@ class NewsScraper:
         Example:
             >>> scraper.stop()
         """
+        if self.session:
+            self.session.close()
+            self.session = None
+
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except WebDriverException as e:
+                logger.warning(f"WebDriver did not quit cleanly: {e}")
             self.driver = None
             logger.info("WebDriver closed")
 
+    def reset(self) -> None:
+        """
+        Prepare a running scraper for the next monitoring cycle.
+
+        The browser is kept alive and returned to a blank page; it is
+        restarted only if it no longer responds. The HTTP session is dropped
+        so it picks up the browser's current cookies on next use.
+
+        Example:
+            >>> scraper.reset()
+            >>> articles = scraper.scrape_articles()
+        """
+        if self.session:
+            self.session.close()
+            self.session = None
+
+        if self.driver is None:
+            self.start()
+            return
+
+        try:
+            self.driver.get('about:blank')
+        except WebDriverException as e:
+            logger.warning(f"WebDriver unresponsive, restarting: {e}")
+            self.stop()
+            self.start()
+
     def scrape_articles(self, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Scrape articles from the website and filter by keywords.
@@ -177,6 +376,7 @@ class NewsScraper:
 
         max_pages = max_pages or self.config.max_pages
         all_articles = []
+        seen_ids = set()  # Articles repeated across pages (e.g. sticky posts)
 
         try:
             logger.info(f"Starting scrape of {self.config.site_url}")
@@ -184,25 +384,47 @@ class NewsScraper:
             for page_num in range(1, max_pages + 1):
                 logger.info(f"Scraping page {page_num}/{max_pages}")
 
-                # Navigate to page
                 page_url = self._get_page_url(page_num)
-                self.driver.get(page_url)
 
-                # Random delay to avoid detection
+                # Random delay to avoid detection (once per page, whichever way it is fetched)
                 self._random_delay()
 
-                # Extract articles from current page
-                page_articles = self._extract_articles_from_page()
+                # Server-rendered listings are read over plain HTTP
+                page_soup = self._fetch_static_page(page_url)
+                page_articles = []
+                if page_soup is not None:
+                    page_articles = self._extract_articles_from_soup(page_soup)
+
+                if not page_articles:
+                    # Fall back to rendering the page in the browser
+                    page_soup = None
+                    self.driver.get(page_url)
+
+                    # Extract articles from current page
+                    page_articles = self._extract_articles_from_page()
 
                 if not page_articles:
                     logger.info(f"No more articles found on page {page_num}")
                     break
 
+                found_count = len(page_articles)
+                page_articles = [
+                    article for article in page_articles
+                    if article['article_id'] not in seen_ids and not seen_ids.add(article['article_id'])
+                ]
+                if not page_articles:
+                    logger.info(f"Page {page_num} only repeats earlier articles")
+                    break
+
                 all_articles.extend(page_articles)
-                logger.info(f"Found {len(page_articles)} articles on page {page_num}")
+                logger.info(f"Found {len(page_articles)} articles on page {page_num} ({found_count - len(page_articles)} repeated)")
 
                 # Check if there's a next page
-                if not self._has_next_page():
+                if page_soup is not None:
+                    has_next = NEXT_PAGE_STATIC_SELECTOR.select_one(page_soup) is not None
+                else:
+                    has_next = self._has_next_page()
+                if not has_next:
                     logger.info("Reached last page")
                     break
 
@@ -248,35 +470,50 @@ class NewsScraper:
         Note:
             This method contains site-specific selectors that may need adjustment
         """
-        articles = []
-
         try:
             # Wait for articles to load
             wait = WebDriverWait(self.driver, 10)
 
-            # Common article container selectors (try multiple)
-            article_selectors = [
-                'article',
-                '.article',
-                '.post',
-                '.news-item',
-                '.entry',
-                '[class*="article"]',
-            ]
+            # Wait once for any article container rather than per selector
+            try:
+                with self._no_implicit_wait():
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_SELECTOR_UNION)))
+            except TimeoutException:
+                logger.warning("No article elements found on page")
+                return []
+
+            # Parse the loaded page once and select articles from that tree,
+            # instead of pulling each element's outerHTML over the driver
+            return self._extract_articles_from_soup(
+                BeautifulSoup(self.driver.page_source, HTML_PARSER)
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to extract articles: {e}")
+            return []
+
+    def _extract_articles_from_soup(self, page_soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """
+        Extract article information from a parsed listing page.
+
+        Args:
+            page_soup: Parsed page HTML
+
+        Returns:
+            List of article dictionaries
+        """
+        articles = []
 
+        try:
             article_elements = None
-            for selector in article_selectors:
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    article_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if article_elements:
-                        logger.debug(f"Found {len(article_elements)} articles using selector: {selector}")
-                        break
-                except TimeoutException:
-                    continue
+            for selector in ARTICLE_SELECTORS:
+                article_elements = page_soup.select(selector)
+                if article_elements:
+                    logger.debug(f"Found {len(article_elements)} articles using selector: {selector}")
+                    break
 
             if not article_elements:
-                logger.warning("No article elements found on page")
+                logger.debug("No article elements found in page HTML")
                 return []
 
             # Parse each article
@@ -285,9 +522,6 @@ class NewsScraper:
                     article = self._parse_article_element(element)
                     if article:
                         articles.append(article)
-                except StaleElementReferenceException:
-                    logger.debug("Stale element encountered, skipping")
-                    continue
                 except Exception as e:
                     logger.warning(f"Failed to parse article element: {e}")
                     continue
@@ -297,12 +531,12 @@ class NewsScraper:
 
         return articles
 
-    def _parse_article_element(self, element) -> Optional[Dict[str, Any]]:
+    def _parse_article_element(self, soup: Tag) -> Optional[Dict[str, Any]]:
         """
         Parse individual article element to extract information.
 
         Args:
-            element: Selenium WebElement representing an article
+            soup: BeautifulSoup tag of the article element in the parsed page
 
         Returns:
             Dictionary with article information or None if parsing fails
@@ -311,18 +545,11 @@ class NewsScraper:
             Selectors may need adjustment based on actual site structure
         """
         try:
-            # Get article HTML for BeautifulSoup parsing
-            html = element.get_attribute('outerHTML')
-            soup = BeautifulSoup(html, 'html.parser')
-
             # Extract title
             title = None
-            title_selectors = ['h2', 'h3', '.title', '.headline', 'a']
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    break
+            title_elem = _select_first(soup, TITLE_SELECTORS)
+            if title_elem is not None:
+                title = title_elem.get_text(strip=True)
 
             if not title:
                 logger.debug("Article title not found")
@@ -339,22 +566,16 @@ class NewsScraper:
 
             # Extract date (if available)
             published_date = None
-            date_selectors = ['.date', '.published', 'time', '[datetime]']
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    date_text = date_elem.get('datetime') or date_elem.get_text(strip=True)
-                    published_date = self._parse_date(date_text)
-                    break
+            date_elem = _select_first(soup, DATE_SELECTORS)
+            if date_elem is not None:
+                date_text = date_elem.get('datetime') or date_elem.get_text(strip=True)
+                published_date = self._parse_date(date_text)
 
             # Extract summary/excerpt
             summary = None
-            summary_selectors = ['.excerpt', '.summary', 'p']
-            for selector in summary_selectors:
-                summary_elem = soup.select_one(selector)
-                if summary_elem:
-                    summary = summary_elem.get_text(strip=True)
-                    break
+            summary_elem = _select_first(soup, SUMMARY_SELECTORS)
+            if summary_elem is not None:
+                summary = summary_elem.get_text(strip=True)
 
             # Generate unique article ID
             article_id = self._generate_article_id(url, title)
@@ -387,16 +608,28 @@ class NewsScraper:
             List of articles matching keywords with matched_keyword field added
         """
         matched_articles = []
-        keywords = self.config.keywords + self.config.urgent_keywords
+
+        # Read config and build the keyword matcher once, outside the per-article loop
+        pattern, keywords, urgent_keywords = _keyword_matcher(
+            tuple(self.config.keywords),
+            tuple(self.config.urgent_keywords)
+        )
 
         for article in articles:
             # Check title and summary for keywords
-            text_to_search = f"{article['title']} {article.get('summary', '')}".lower()
+            text_to_search = f"{article['title']} {article.get('summary', '')}"
+
+            # Most articles match nothing; reject those with a single regex scan
+            # before paying for the lowercased copy
+            if not pattern.search(text_to_search):
+                continue
+            text_to_search = text_to_search.lower()
 
-            for keyword in keywords:
-                if keyword.lower() in text_to_search:
+            # Several keywords may occur; the first configured one wins
+            for keyword, keyword_lower in keywords:
+                if keyword_lower in text_to_search:
                     article['matched_keyword'] = keyword
-                    article['is_urgent'] = keyword in self.config.urgent_keywords
+                    article['is_urgent'] = keyword in urgent_keywords
                     matched_articles.append(article)
                     logger.debug(f"Article matched keyword '{keyword}': {article['title']}")
                     break  # Only match first keyword
@@ -407,6 +640,10 @@ class NewsScraper:
         """
         Fetch full article content from article page.
 
+        The page is first fetched over plain HTTP, which is thread-safe and lets
+        callers fetch several articles concurrently. The Selenium driver is only
+        used (serialized behind a lock) when no content could be extracted that way.
+
         Args:
             article_url: URL of the article
 
@@ -416,6 +653,135 @@ class NewsScraper:
         Example:
             >>> content = scraper.fetch_full_content(article['url'])
         """
+        content = self._fetch_static_content(article_url)
+        if content:
+            return content
+
+        with self._driver_lock:
+            return self._fetch_rendered_content(article_url)
+
+    def fetch_full_content_many(self, article_urls: List[str], max_workers: Optional[int] = None) -> List[str]:
+        """
+        Fetch full content for several articles concurrently.
+
+        Each URL goes through fetch_full_content on a bounded thread pool, so
+        the HTTP fetches overlap while browser fallbacks stay serialized.
+
+        Args:
+            article_urls: URLs of the articles
+            max_workers: Concurrent fetches (None for `scraping.content_workers`)
+
+        Returns:
+            Article contents in the same order as article_urls
+
+        Example:
+            >>> contents = scraper.fetch_full_content_many([a['url'] for a in articles])
+        """
+        if not article_urls:
+            return []
+
+        max_workers = max_workers or self.config.get('scraping.content_workers', 4)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(article_urls))) as executor:
+            return list(executor.map(self.fetch_full_content, article_urls))
+
+    def _get_http_session(self) -> requests.Session:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Browser cookies are copied into the session so that authenticated
+        content stays accessible.
+
+        Returns:
+            requests.Session instance
+        """
+        with self._driver_lock:
+            if self.session is None:
+                session = requests.Session()
+                # One pooled connection per concurrent content fetch
+                pool_size = max(self.config.get('scraping.content_workers', 4), 10)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                if self.driver:
+                    session.headers['User-Agent'] = self.driver.execute_script(
+                        "return navigator.userAgent"
+                    )
+                    for cookie in self.driver.get_cookies():
+                        session.cookies.set(
+                            cookie['name'], cookie['value'],
+                            domain=cookie.get('domain'), path=cookie.get('path', '/')
+                        )
+                self.session = session
+        return self.session
+
+    def _fetch_static_page(self, page_url: str) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a listing page over HTTP without rendering JavaScript.
+
+        Args:
+            page_url: URL of the listing page
+
+        Returns:
+            Parsed page, or None if disabled via `scraping.static_listing`
+            or the request failed
+        """
+        if not self.config.get('scraping.static_listing', True):
+            return None
+
+        try:
+            logger.debug(f"Fetching listing over HTTP: {page_url}")
+            response = self._get_http_session().get(
+                page_url, timeout=self.config.request_timeout
+            )
+            response.raise_for_status()
+            return BeautifulSoup(response.text, HTML_PARSER)
+
+        except Exception as e:
+            logger.debug(f"HTTP listing fetch failed for {page_url}: {e}")
+            return None
+
+    def _fetch_static_content(self, article_url: str) -> str:
+        """
+        Fetch article content over HTTP without rendering JavaScript.
+
+        Args:
+            article_url: URL of the article
+
+        Returns:
+            Article content as text, or empty string if not found
+        """
+        try:
+            logger.debug(f"Fetching full content over HTTP from: {article_url}")
+            self._random_delay()
+            response = self._get_http_session().get(
+                article_url, timeout=self.config.request_timeout
+            )
+            response.raise_for_status()
+
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            for selector in CONTENT_SELECTORS:
+                content_elem = soup.select_one(selector)
+                if content_elem:
+                    content = content_elem.get_text('\n', strip=True)
+                    if content:
+                        return content
+
+            return ''
+
+        except Exception as e:
+            logger.debug(f"HTTP content fetch failed for {article_url}: {e}")
+            return ''
+
+    def _fetch_rendered_content(self, article_url: str) -> str:
+        """
+        Fetch article content by rendering the page in the browser.
+
+        Args:
+            article_url: URL of the article
+
+        Returns:
+            Full article content as text
+        """
         try:
             logger.debug(f"Fetching full content from: {article_url}")
             self.driver.get(article_url)
@@ -424,30 +790,23 @@ class NewsScraper:
             # Wait for content to load
             wait = WebDriverWait(self.driver, 10)
 
-            # Common content selectors
-            content_selectors = [
-                '.article-content',
-                '.entry-content',
-                '.post-content',
-                'article .content',
-                '[class*="content"]',
-            ]
-
             content = None
-            for selector in content_selectors:
+            with self._no_implicit_wait():
+                # Wait once for any content container, then probe in priority order
                 try:
-                    content_elem = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    content = content_elem.text
-                    break
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, CONTENT_SELECTOR_UNION)))
+                    for selector in CONTENT_SELECTORS:
+                        content_elems = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                        if content_elems:
+                            content = content_elems[0].text
+                            break
                 except TimeoutException:
-                    continue
+                    pass
 
-            if not content:
-                # Fallback: get all paragraph text
-                paragraphs = self.driver.find_elements(By.TAG_NAME, 'p')
-                content = '\n\n'.join([p.text for p in paragraphs if p.text.strip()])
+                if not content:
+                    # Fallback: get all paragraph text
+                    paragraphs = self.driver.find_elements(By.TAG_NAME, 'p')
+                    content = '\n\n'.join([p.text for p in paragraphs if p.text.strip()])
 
             return content.strip()
 
@@ -466,27 +825,30 @@ class NewsScraper:
             This may need customization based on actual site pagination
         """
         try:
-            # Common "next page" selectors
-            next_page_selectors = [
-                'a.next',
-                'a[rel="next"]',
-                '.pagination .next',
-                'a:contains("次へ")',  # Japanese "next"
-                'a:contains("Next")',
-            ]
-
-            for selector in next_page_selectors:
-                try:
-                    self.driver.find_element(By.CSS_SELECTOR, selector)
+            # find_elements returns an empty list on a miss, so with the
+            # implicit wait off each probe is a single immediate round-trip
+            with self._no_implicit_wait():
+                if self.driver.find_elements(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR):
                     return True
-                except NoSuchElementException:
-                    continue
-
-            return False
+                return bool(self.driver.find_elements(By.XPATH, NEXT_PAGE_TEXT_XPATH))
 
         except Exception:
             return False
 
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily disable the implicit wait.
+
+        Used around lookups for elements that may legitimately be absent,
+        so a miss returns immediately instead of waiting the full timeout.
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+
     def _random_delay(self) -> None:
         """
         Add random delay between requests to avoid detection.
@@ -506,8 +868,10 @@ class NewsScraper:
         Returns:
             Unique article ID (MD5 hash)
         """
+        # The ID is the duplicate-detection key stored in the database, so the
+        # algorithm must not change; MD5 is only a fingerprint here
         content = f"{url}|{title}".encode('utf-8')
-        return hashlib.md5(content).hexdigest()
+        return hashlib.md5(content, usedforsecurity=False).hexdigest()
 
     def _parse_date(self, date_string: str) -> Optional[str]:
         """
@@ -520,21 +884,16 @@ class NewsScraper:
             ISO format date string or None if parsing fails
         """
         try:
-            # Try common date formats
-            formats = [
-                '%Y-%m-%d',
-                '%Y/%m/%d',
-                '%Y年%m月%d日',  # Japanese format
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%d %H:%M:%S',
-            ]
-
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(date_string[:19], fmt)
-                    return dt.isoformat()
-                except ValueError:
-                    continue
+            # Pick the format by pattern instead of trying strptime on each
+            text = date_string[:19]
+            for pattern in DATE_PATTERNS:
+                match = pattern.fullmatch(text)
+                if match:
+                    try:
+                        fields = [int(field) for field in match.groups() if field is not None]
+                        return datetime(*fields).isoformat()
+                    except ValueError:
+                        break  # Out-of-range value, e.g. month 13
 
             # If all else fails, return original
             return date_string
@@ -557,42 +916,21 @@ class NewsScraper:
         Example:
             >>> is_member = scraper._is_member_only_article(soup, title, summary)
         """
-        # Check for member-only indicators in text
-        member_indicators = [
-            '会員限定',  # Member limited (Japanese)
-            '会員専用',  # Member exclusive (Japanese)
-            'プレミアム',  # Premium (Japanese)
-            '有料会員',  # Paid member (Japanese)
-            '登録会員',  # Registered member (Japanese)
-            'member-only',
-            'premium',
-            'subscription'
-        ]
-
         # Check in title and summary
-        text_to_check = f"{title} {summary}".lower()
-        for indicator in member_indicators:
-            if indicator.lower() in text_to_check:
-                logger.debug(f"Member-only indicator found in text: {indicator}")
+        for text in (title, summary):
+            match = MEMBER_TEXT_RE.search(text)
+            if match:
+                logger.debug("Member-only indicator found in text: %s", match.group())
                 return True
 
-        # Check for CSS classes
-        article_html = str(soup)
-        class_indicators = [
-            'member-only',
-            'premium',
-            'subscriber-only',
-            'paywall',
-            'locked'
-        ]
-
-        for indicator in class_indicators:
-            if indicator in article_html.lower():
-                logger.debug(f"Member-only indicator found in HTML: {indicator}")
-                return True
+        # Check for CSS classes on the element or its descendants
+        marked = soup if MEMBER_CLASS_SELECTOR.match(soup) else MEMBER_CLASS_SELECTOR.select_one(soup)
+        if marked is not None:
+            logger.debug("Member-only indicator found in HTML: %s", ' '.join(marked.get('class', [])))
+            return True
 
         # Check for lock icons or indicators
-        if '🔒' in text_to_check or '&#128274;' in article_html:
+        if '🔒' in title or '🔒' in summary:
             logger.debug("Lock icon found - member-only article")
             return True
 
@@ -625,21 +963,9 @@ class NewsScraper:
             wait = WebDriverWait(self.driver, 10)
 
             # Check for login required messages
-            login_indicators = [
-                'ログインが必要です',  # Login required (Japanese)
-                'ログインしてください',  # Please login (Japanese)
-                '会員登録が必要',  # Membership required (Japanese)
-                'この記事を読むには',  # To read this article (Japanese)
-                'login required',
-                'sign in to read',
-                'subscription required'
-            ]
-
-            page_source = self.driver.page_source.lower()
-            for indicator in login_indicators:
-                if indicator.lower() in page_source:
-                    logger.warning(f"Login required for article: {article_url}")
-                    return None
+            if LOGIN_REQUIRED_RE.search(self.driver.page_source):
+                logger.warning(f"Login required for article: {article_url}")
+                return None
 
             # Try to fetch content using existing method
             content = self.fetch_full_content(article_url)
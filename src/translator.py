@@ -4,18 +4,65 @@ Translation Module
 This module handles translation of Japanese article titles to Korean.
 Features:
 - Automatic Japanese to Korean translation
-- Translation caching for performance
+- Translation caching for performance (in memory, optionally persisted)
 - Error handling with fallback
 - Rate limiting protection
 """
 
+import hashlib
 import logging
+import re
+import sqlite3
+import threading
 import time
-from typing import Optional, Dict, List
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
 from deep_translator import GoogleTranslator
 
+from .database import journal_mode
+
 logger = logging.getLogger(__name__)
 
+# Translations kept in memory per translator (long-running daemons stay bounded)
+MAX_CACHE_ENTRIES = 10_000
+
+CREATE_CACHE_TABLE_SQL = (
+    'CREATE TABLE IF NOT EXISTS translations ('
+    'key BLOB PRIMARY KEY, translated TEXT NOT NULL) WITHOUT ROWID'
+)
+SELECT_TRANSLATION_SQL = 'SELECT translated FROM translations WHERE key = ?'
+INSERT_TRANSLATION_SQL = 'INSERT OR REPLACE INTO translations (key, translated) VALUES (?, ?)'
+
+# Kana, CJK ideographs and half-width katakana: text without any is not Japanese
+JAPANESE_SCRIPT_RE = re.compile('[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]')
+
+# Batched texts are joined into one request. The text travels URL-encoded in a
+# GET query (about 9 bytes per Japanese character), so joined payloads are kept
+# far below deep-translator's 5000-character limit to stay within URL limits
+BATCH_SEPARATOR = '\n'
+MAX_BATCH_CHARS = 1500
+
+
+def _batch_chunks(texts: List[str]) -> List[List[str]]:
+    """Group texts into joined-request payloads of at most MAX_BATCH_CHARS."""
+    chunks: List[List[str]] = []
+    size = MAX_BATCH_CHARS + 1  # Forces a new chunk for the first text
+    for text in texts:
+        if BATCH_SEPARATOR in text or size + len(BATCH_SEPARATOR) + len(text) > MAX_BATCH_CHARS:
+            chunks.append([text])
+            size = MAX_BATCH_CHARS + 1 if BATCH_SEPARATOR in text else len(text)
+        else:
+            chunks[-1].append(text)
+            size += len(BATCH_SEPARATOR) + len(text)
+    return chunks
+
+
+def _cache_key(text: str) -> bytes:
+    """Fixed-size cache key for a source text."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
 
 class ArticleTranslator:
     """
@@ -28,18 +75,39 @@ class ArticleTranslator:
     - Rate limiting protection
     """
 
-    def __init__(self):
-        """Initialize translator with Google Translate (free)."""
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize translator with Google Translate (free).
+
+        Args:
+            cache_path: SQLite file that persists translations across runs
+                (None keeps the cache in memory only)
+        """
+        self._store: Optional[sqlite3.Connection] = None
+        self._store_lock = threading.Lock()
+        # Most recent (text, translation), checked before the cache dict; one
+        # tuple so concurrent readers never see a key paired with another value
+        self._last_entry: Optional[Tuple[str, str]] = None
+        self._cache_lock = threading.Lock()
+        self.max_cache_entries = MAX_CACHE_ENTRIES
+        if cache_path:
+            self._open_store(cache_path)
+
         try:
             self.translator = GoogleTranslator(source='ja', target='ko')
+            self._local = threading.local()
+            self._local.backend = self.translator
             self.cache: Dict[str, str] = {}  # Translation cache
             self.last_request_time = 0.0
             self.min_request_interval = 0.5  # seconds (Rate limit protection)
+            self._rate_limit_lock = threading.Lock()
             logger.info("ArticleTranslator initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize translator: {e}")
             self.translator = None
+            self._local = threading.local()
             self.cache = {}
+            self._rate_limit_lock = threading.Lock()
 
     def translate(self, text: str) -> Optional[str]:
         """
@@ -61,33 +129,44 @@ class ArticleTranslator:
             logger.debug("Empty text provided for translation")
             return None
 
+        last_entry = self._last_entry
+        if last_entry is not None and last_entry[0] == text:
+            return last_entry[1]
+
+        # Text with no Japanese script (Korean, plain ASCII, ...) is returned as is
+        if not JAPANESE_SCRIPT_RE.search(text):
+            logger.debug(f"No Japanese text, skipping translation: {text[:30]}...")
+            return text
+
         if not self.translator:
             logger.warning("Translator not initialized, skipping translation")
             return None
 
         # Check cache first
-        if text in self.cache:
+        cached = self.cache.get(text)
+        if cached is not None:
             logger.debug(f"Translation cache hit: {text[:30]}...")
-            return self.cache[text]
+            self._last_entry = (text, cached)
+            return cached
+
+        # Then translations persisted by earlier runs
+        persisted = self._load_persisted(text)
+        if persisted is not None:
+            logger.debug(f"Persistent translation cache hit: {text[:30]}...")
+            self._cache_put(text, persisted)
+            return persisted
 
         try:
             # Rate limiting (prevent too many requests)
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.min_request_interval:
-                sleep_time = self.min_request_interval - time_since_last
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+            self._wait_for_request_slot()
 
             # Perform translation
             logger.debug(f"Translating: {text[:50]}...")
-            translated = self.translator.translate(text)
-
-            self.last_request_time = time.time()
+            translated = self._get_backend().translate(text)
 
             # Cache the result
             if translated:
-                self.cache[text] = translated
+                self._remember(text, translated)
                 logger.info(f"Translation success: {text[:30]}... → {translated[:30]}...")
                 return translated
             else:
@@ -98,12 +177,108 @@ class ArticleTranslator:
             logger.error(f"Translation failed for '{text[:50]}...': {e}")
             return None
 
-    def translate_batch(self, texts: List[str]) -> Dict[str, Optional[str]]:
+    def _wait_for_request_slot(self) -> None:
+        """
+        Block until the next translation request may be sent.
+
+        The slot is reserved under the lock so concurrent callers stay spaced
+        out by min_request_interval while their requests overlap in flight.
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.min_request_interval:
+                sleep_time = self.min_request_interval - time_since_last
+                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+            self.last_request_time = time.time()
+
+    def _remember(self, text: str, translated: str) -> None:
+        """Store a fresh translation in the memory and persistent caches."""
+        self._cache_put(text, translated)
+        self._persist(text, translated)
+
+    def _cache_put(self, text: str, translated: str) -> None:
+        """
+        Add a translation to the memory cache, evicting the oldest entries
+        beyond max_cache_entries (evicted ones remain in the persistent store).
+        """
+        with self._cache_lock:
+            self.cache[text] = translated
+            while len(self.cache) > self.max_cache_entries:
+                del self.cache[next(iter(self.cache))]
+        self._last_entry = (text, translated)
+
+    def _open_store(self, cache_path: str) -> None:
         """
-        Translate multiple texts.
+        Open (creating if needed) the on-disk translation cache.
+
+        Failures are logged and leave the translator with the memory cache only.
+
+        Args:
+            cache_path: SQLite file path
+        """
+        try:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            store = sqlite3.connect(cache_path, check_same_thread=False)
+            store.execute(f'PRAGMA journal_mode={journal_mode()}')
+            store.execute(CREATE_CACHE_TABLE_SQL)
+            store.commit()
+            self._store = store
+            logger.debug("Translation cache opened: %s", cache_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Persistent translation cache unavailable (%s): %s", cache_path, e)
+
+    def _load_persisted(self, text: str) -> Optional[str]:
+        """Look up a translation saved by an earlier run."""
+        if self._store is None:
+            return None
+        try:
+            with self._store_lock:
+                row = self._store.execute(SELECT_TRANSLATION_SQL, (_cache_key(text),)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.debug("Translation cache read failed: %s", e)
+            return None
+
+    def _persist(self, text: str, translated: str) -> None:
+        """Save a translation for later runs."""
+        if self._store is None:
+            return
+        try:
+            with self._store_lock:
+                with self._store:
+                    self._store.execute(INSERT_TRANSLATION_SQL, (_cache_key(text), translated))
+        except sqlite3.Error as e:
+            logger.debug("Translation cache write failed: %s", e)
+
+    def _get_backend(self) -> GoogleTranslator:
+        """
+        Get the translation backend for the current thread.
+
+        GoogleTranslator keeps per-request state on the instance, so each
+        thread gets its own backend to allow concurrent translations.
+
+        Returns:
+            GoogleTranslator instance owned by the calling thread
+        """
+        backend = getattr(self._local, 'backend', None)
+        if backend is None:
+            backend = GoogleTranslator(source='ja', target='ko')
+            self._local.backend = backend
+        return backend
+
+    def translate_batch(self, texts: List[str], max_workers: int = 4) -> Dict[str, Optional[str]]:
+        """
+        Translate multiple texts concurrently.
+
+        Duplicates are translated once and cached texts are not resubmitted.
+        Single-line texts are sent several per request, joined by newlines;
+        requests still go out spaced by the shared rate limit.
 
         Args:
             texts: List of Japanese texts
+            max_workers: Number of translations in flight at once
 
         Returns:
             Dictionary mapping original text to translated text
@@ -114,27 +289,81 @@ class ArticleTranslator:
             >>> print(results)
             {"テスト1": "테스트1", "テスト2": "테스트2"}
         """
-        results = {}
+        # Keep the input order; duplicates collapse onto one entry
+        results: Dict[str, Optional[str]] = dict.fromkeys(texts)
         total = len(texts)
 
         logger.info(f"Starting batch translation of {total} texts...")
 
-        for index, text in enumerate(texts, 1):
-            logger.debug(f"Translating {index}/{total}")
-            translated = self.translate(text)
-            results[text] = translated
+        pending = []
+        for text in results:
+            if (self.translator and text and text.strip() and JAPANESE_SCRIPT_RE.search(text)
+                    and text not in self.cache and self._load_persisted(text) is None):
+                pending.append(text)
+            else:
+                results[text] = self.translate(text)  # Answered without a request
+
+        if pending:
+            chunks = _batch_chunks(pending)
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+                futures = [executor.submit(self._translate_chunk, chunk) for chunk in chunks]
+                for index, future in enumerate(as_completed(futures), 1):
+                    logger.debug(f"Translated request {index}/{len(chunks)}")
+                    results.update(future.result())
 
         success_count = sum(1 for v in results.values() if v is not None)
         logger.info(f"Batch translation complete: {success_count}/{total} successful")
 
         return results
 
+    def _translate_chunk(self, chunk: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate a group of single-line texts with one request.
+
+        Falls back to one request per text when the joined translation does
+        not come back as exactly one non-empty line per text.
+
+        Args:
+            chunk: Texts from _batch_chunks
+
+        Returns:
+            Dictionary mapping each text to its translation
+        """
+        if len(chunk) > 1 and all(BATCH_SEPARATOR not in text for text in chunk):
+            lines: List[str] = []
+            try:
+                self._wait_for_request_slot()
+                translated = self._get_backend().translate(BATCH_SEPARATOR.join(chunk))
+                lines = [line.strip() for line in translated.split(BATCH_SEPARATOR)] if translated else []
+            except Exception as e:
+                logger.warning(f"Joined translation of {len(chunk)} texts failed: {e}")
+
+            if len(lines) == len(chunk) and all(lines):
+                for text, line in zip(chunk, lines):
+                    self._remember(text, line)
+                return dict(zip(chunk, lines))
+
+            logger.debug(f"Joined translation did not split into {len(chunk)} lines, translating individually")
+
+        return {text: self.translate(text) for text in chunk}
+
     def clear_cache(self):
         """Clear translation cache."""
-        cache_size = len(self.cache)
-        self.cache.clear()
+        with self._cache_lock:
+            cache_size = len(self.cache)
+            self.cache.clear()
+        self._last_entry = None
         logger.info(f"Translation cache cleared ({cache_size} entries)")
 
+    def clear_persisted_cache(self):
+        """Delete every translation saved in the on-disk cache, if one is open."""
+        if self._store is None:
+            return
+        with self._store_lock:
+            with self._store:
+                deleted = self._store.execute('DELETE FROM translations').rowcount
+        logger.info(f"Persisted translation cache cleared ({deleted} entries)")
+
     def get_cache_size(self) -> int:
         """Get number of cached translations."""
         return len(self.cache)
@@ -144,35 +373,40 @@ class ArticleTranslator:
         return f"ArticleTranslator(cached={len(self.cache)})"
 
 
-# Module-level singleton instance
-_translator_instance: Optional[ArticleTranslator] = None
-
-
-def get_translator() -> ArticleTranslator:
+@lru_cache(maxsize=1)
+def get_translator(cache_path: Optional[str] = None) -> ArticleTranslator:
     """
-    Get singleton translator instance.
+    Get singleton translator instance (created on first call, then cached).
+
+    Args:
+        cache_path: SQLite file that persists translations across runs
+            (None keeps the cache in memory only), usually
+            Config.translation_cache_path
 
     Returns:
         ArticleTranslator instance
 
     Example:
-        >>> translator = get_translator()
+        >>> translator = get_translator(config.translation_cache_path)
         >>> result = translator.translate("バンドー化学")
     """
-    global _translator_instance
-    if _translator_instance is None:
-        _translator_instance = ArticleTranslator()
-    return _translator_instance
+    return ArticleTranslator(cache_path=cache_path)
 
 
-def clear_translator_cache():
+def clear_translator_cache(cache_path: Optional[str] = None):
     """
-    Clear the singleton translator's cache.
+    Clear the singleton translator's in-memory cache.
+
+    Translations persisted on disk are kept; use
+    ArticleTranslator.clear_persisted_cache() to remove those.
+
+    Args:
+        cache_path: The cache_path the singleton was created with
 
     Example:
-        >>> clear_translator_cache()
+        >>> clear_translator_cache(config.translation_cache_path)
     """
-    translator = get_translator()
+    translator = get_translator(cache_path)
     translator.clear_cache()
 
 
@@ -0,0 +1,50 @@
+"""
+Unit tests for the config module.
+
+Run with: pytest tests/test_config.py
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.config import Config
+
+
+PROJECT_CONFIG = Path(__file__).parent.parent / "config.yaml"
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Copy the project configuration into a temporary directory."""
+    path = tmp_path / "config.yaml"
+    shutil.copyfile(PROJECT_CONFIG, path)
+    return path
+
+
+def test_config_cache_reused_for_unchanged_file(config_path):
+    """Test an unchanged YAML file is served from the JSON cache."""
+    first = Config(str(config_path)).config
+
+    assert (config_path.parent / ".config.yaml.cache.json").exists()
+    assert Config(str(config_path)).config == first
+
+
+def test_config_cache_ignored_for_older_replacement(config_path):
+    """Test a replaced YAML file with an older mtime is parsed again."""
+    Config(str(config_path))
+
+    config_path.write_text(config_path.read_text(encoding='utf-8') + "\nextra_setting: 1\n", encoding='utf-8')
+    os.utime(config_path, (0, 0))  # As restored by cp -p, tar or rsync -a
+
+    assert Config(str(config_path)).config['extra_setting'] == 1
+
+
+def test_config_cache_corrupt_falls_back_to_yaml(config_path):
+    """Test a truncated cache file falls back to parsing the YAML."""
+    expected = Config(str(config_path)).config
+    (config_path.parent / ".config.yaml.cache.json").write_text('{"source": [', encoding='utf-8')
+
+    assert Config(str(config_path)).config == expected
@@ -0,0 +1,53 @@
+"""
+Unit tests for the database module.
+
+Run with: pytest tests/test_database.py
+"""
+
+import pytest
+
+from src.database import Database
+
+
+@pytest.fixture
+def db():
+    """Create an empty in-memory database for each test."""
+    db = Database(":memory:")
+    yield db
+    db.close()
+
+
+def _article(article_id):
+    return {
+        'article_id': article_id,
+        'title': f'記事 {article_id}',
+        'url': f'https://gomuhouchi.com/{article_id}',
+        'matched_keyword': 'ゴム',
+    }
+
+
+def test_try_insert_articles_returns_newly_inserted(db):
+    """Test only articles not stored yet are inserted and returned, once each."""
+    db.add_article(_article('stored'))
+
+    articles = [_article('new-1'), _article('stored'), _article('new-2'), _article('new-1')]
+    inserted = db.try_insert_articles(articles)
+
+    assert [a['article_id'] for a in inserted] == ['new-1', 'new-2']
+    assert db.try_insert_articles(articles) == []
+
+
+def test_try_insert_articles_skips_rows_added_elsewhere(tmp_path):
+    """Test rows another connection inserted are detected by the insert itself."""
+    db_path = str(tmp_path / "articles.db")
+    db = Database(db_path)
+    other = Database(db_path)
+    try:
+        other.add_article(_article('from-other-run'))
+
+        inserted = db.try_insert_articles([_article('from-other-run'), _article('new')])
+
+        assert [a['article_id'] for a in inserted] == ['new']
+    finally:
+        other.close()
+        db.close()
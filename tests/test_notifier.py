@@ -0,0 +1,80 @@
+"""
+Unit tests for the notifier module.
+
+Run with: pytest tests/test_notifier.py
+"""
+
+import smtplib
+import pytest
+from unittest.mock import Mock, MagicMock
+
+from src.config import Config
+from src.notifier import Notifier
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock configuration with one recipient and individual emails."""
+    config = Mock(spec=Config)
+    config.email_from = "monitor@example.com"
+    config.email_password = "secret"
+    config.email_recipients = ["team@example.com"]
+    config.smtp_server = "smtp.example.com"
+    config.smtp_port = 587
+    config.use_tls = True
+    config.batch_notifications = False
+    config.get.side_effect = lambda key, default=None: default
+    return config
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """Replace smtplib.SMTP with a mock whose connections all succeed."""
+    server = MagicMock()
+    server.noop.return_value = (250, b'OK')
+    server.has_extn.return_value = False
+    server.sendmail.return_value = {}
+
+    smtp_class = Mock(return_value=server)
+    monkeypatch.setattr(smtplib, 'SMTP', smtp_class)
+    return server
+
+
+def _article(index, is_urgent=False):
+    return {
+        'article_id': f'id-{index}',
+        'title': f'記事 {index}',
+        'url': f'https://gomuhouchi.com/{index}',
+        'matched_keyword': 'ゴム',
+        'summary': '',
+        'published_date': None,
+        'is_urgent': is_urgent,
+    }
+
+
+@pytest.mark.parametrize("batch,expected", [
+    (True, [['id-0'], ['id-1', 'id-2']]),
+    (False, [['id-0'], ['id-1'], ['id-2']]),
+])
+def test_group_articles(mock_config, batch, expected):
+    """Test urgent articles share the first email and normal ones follow the batch setting."""
+    mock_config.batch_notifications = batch
+    notifier = Notifier(mock_config)
+
+    groups = notifier.group_articles([_article(1), _article(0, is_urgent=True), _article(2)])
+
+    assert [[a['article_id'] for a in group] for group in groups] == expected
+
+
+def test_session_logs_in_once_across_groups(mock_config, smtp_server):
+    """Test every email sent inside one session shares one SMTP login."""
+    notifier = Notifier(mock_config)
+    articles = [_article(0, is_urgent=True), _article(1), _article(2)]
+
+    with notifier.session():
+        for group in notifier.group_articles(articles):
+            assert notifier.send_article_notifications(group)
+
+    assert smtp_server.sendmail.call_count == 3
+    smtp_server.login.assert_called_once()
+    smtp_server.quit.assert_called_once()
@@ -5,17 +5,22 @@ Run with: pytest tests/test_scraper.py
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 from datetime import datetime
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from bs4 import BeautifulSoup
 
-from src.scraper import NewsScraper
+from src.scraper import NewsScraper, NEXT_PAGE_STATIC_SELECTOR
 from src.config import Config
 
 
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+
 @pytest.fixture
 def mock_config():
     """Create a mock configuration object."""
@@ -60,6 +65,9 @@ def test_generate_article_id(scraper):
     article_id_3 = scraper._generate_article_id(url, "Different Title")
     assert article_id_1 != article_id_3
 
+    # IDs are the duplicate-detection key in existing databases; the hash must not change
+    assert article_id_1 == "cac123118a486c67568230bdba306fe3"
+
 
 def test_filter_by_keywords(scraper):
     """Test keyword filtering."""
@@ -88,6 +96,28 @@ def test_filter_by_keywords(scraper):
     assert matched[1]['matched_keyword'] == '三ツ星ベルト'
 
 
+def test_filter_by_keywords_many_articles(scraper):
+    """Test keyword filtering over a large article list."""
+    scraper.config.keywords = ["バンドー化学", "三ツ星ベルト"] + [f"キーワード{i}" for i in range(50)]
+    scraper.config.urgent_keywords = []
+
+    articles = []
+    for i in range(1000):
+        if i % 10 == 0:
+            title = f"三ツ星ベルト ニュース {i}"
+        elif i % 10 == 5:
+            title = f"記事 {i} キーワード{i % 50}"
+        else:
+            title = f"Unrelated article {i}"
+        articles.append({'title': title, 'summary': 'Some summary text ' * 5})
+
+    matched = scraper._filter_by_keywords(articles)
+
+    assert len(matched) == 200
+    assert all(a['matched_keyword'] == "三ツ星ベルト" for a in matched if a['title'].startswith("三ツ星ベルト"))
+    assert {a['matched_keyword'] for a in matched} - {"三ツ星ベルト"} <= {f"キーワード{i}" for i in range(50)}
+
+
 def test_parse_date(scraper):
     """Test date parsing."""
     # ISO format
@@ -103,6 +133,30 @@ def test_parse_date(scraper):
     assert date3 == "invalid date"
 
 
+@pytest.mark.parametrize("date_string,expected", [
+    ("2024-01-15", "2024-01-15T00:00:00"),
+    ("2024/1/5", "2024-01-05T00:00:00"),
+    ("2024年1月5日", "2024-01-05T00:00:00"),
+    ("2024-01-15T10:11:12", "2024-01-15T10:11:12"),
+    ("2024-01-15 10:11:12+09:00", "2024-01-15T10:11:12"),
+    ("2024-13-01", "2024-13-01"),  # Out-of-range month is returned unchanged
+    ("2024.01.15", "2024.01.15"),
+])
+def test_parse_date_formats(scraper, date_string, expected):
+    """Test each supported date format and the unparsed fallback."""
+    assert scraper._parse_date(date_string) == expected
+
+
+@pytest.mark.benchmark(group="scraper")
+@pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark is not installed")
+def test_parse_date_benchmark(request, benchmark, scraper):
+    """Benchmark parsing a Japanese date (run with --benchmark-only)."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmarks only run with --benchmark-only")
+
+    assert benchmark(scraper._parse_date, "2024年01月15日") == "2024-01-15T00:00:00"
+
+
 def test_get_page_url(scraper, mock_config):
     """Test page URL generation."""
     url1 = scraper._get_page_url(1)
@@ -131,13 +185,79 @@ def test_keyword_matching(scraper, keyword, text, should_match):
         assert len(matched) == 0
 
 
-def test_scraper_context_manager(mock_config):
+def _synthetic_texts(count):
+    """Build (title, summary) pairs mixing keywords, case variants and split keywords."""
+    fragments = ["ゴム", "BANDO", "三ツ星ベルト", "タイヤ", "リコール", "市況", "新製品", "決算", "ban", "do"]
+    return [
+        (f"記事{i} {fragments[i % 10]}{fragments[(i * 7) % 10]}", fragments[(i * 3) % 10] if i % 4 else "")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("texts", [
+    [
+        ("ゴム報知の記事", ""),
+        ("BANDO announces results", ""),
+        ("Nothing here", "still nothing"),
+        ("製品", "リコールのお知らせ"),
+        ("ゴム", "リコール"),
+        ("", ""),
+    ],
+    _synthetic_texts(10_000),
+], ids=["handpicked", "synthetic-10k"])
+def test_filter_regex_equivalence(scraper, texts):
+    """Test the regex-based filter matches a plain per-keyword substring scan."""
+    scraper.config.keywords = ["ゴム", "Bando", "ゴム報知", "三ツ星ベルト", "タイヤ"]
+    scraper.config.urgent_keywords = ["リコール", "bando"]
+
+    articles = [{'title': title, 'summary': summary} for title, summary in texts]
+
+    # Reference: first configured keyword contained in the lowercased text
+    ordered = scraper.config.keywords + scraper.config.urgent_keywords
+    expected = []
+    for title, summary in texts:
+        text = f"{title} {summary}".lower()
+        keyword = next((k for k in ordered if k.lower() in text), None)
+        if keyword is not None:
+            expected.append((title, keyword, keyword in scraper.config.urgent_keywords))
+
+    matched = scraper._filter_by_keywords(articles)
+
+    assert [(a['title'], a['matched_keyword'], a['is_urgent']) for a in matched] == expected
+
+
+def test_failed_static_listing_delays_once(scraper, monkeypatch):
+    """Test a page that falls back to the browser waits only one random delay."""
+    delays = []
+    monkeypatch.setattr(scraper, '_random_delay', lambda: delays.append(1))
+    monkeypatch.setattr(scraper, '_get_http_session', Mock(side_effect=OSError("offline")))
+    monkeypatch.setattr(scraper, '_extract_articles_from_page', lambda: [])
+    scraper.driver = Mock()
+
+    assert scraper.scrape_articles(max_pages=1) == []
+    scraper.driver.get.assert_called_once()
+    assert len(delays) == 1
+
+
+@pytest.mark.parametrize("html,has_next", [
+    ('<div class="nav-links"><a href="/page/2">次へ »</a></div>', True),
+    ('<div class="pagination"><a href="/page/2">Next</a></div>', True),
+    ('<a class="next" href="/page/2">»</a>', True),
+    ('<a href="/news/1">Next-generation tire compound unveiled</a>', False),
+])
+def test_next_page_static_selector(html, has_next):
+    """Test next-page link text only counts inside a pagination block."""
+    soup = BeautifulSoup(html, 'html.parser')
+    assert (NEXT_PAGE_STATIC_SELECTOR.select_one(soup) is not None) == has_next
+
+
+def test_scraper_context_manager(mock_config, monkeypatch):
     """Test scraper as context manager."""
-    with patch.object(NewsScraper, 'start'), \
-         patch.object(NewsScraper, 'stop'):
+    monkeypatch.setattr(NewsScraper, 'start', lambda self: None)
+    monkeypatch.setattr(NewsScraper, 'stop', lambda self: None)
 
-        with NewsScraper(mock_config) as scraper:
-            assert scraper is not None
+    with NewsScraper(mock_config) as scraper:
+        assert scraper is not None
 
 
 if __name__ == "__main__":